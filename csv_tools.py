@@ -1,19 +1,46 @@
+import logging
+import logging.handlers
+import numpy as np
 import pandas as pd
 import os
+from functools import lru_cache
 from typing import List
 from tkinter import Tk, filedialog
+from joblib import Parallel, delayed
 """
 Module: CSV Tools
 Description: Contains utilities for loading, saving, and manipulating CSV files, as well as datetime statistics.
 """
 
-def csv_load(file_path=None):
+# Buffered logger for the per-group save loops: messages go out in small
+# batches instead of one blocking stdout write() per saved group. The save
+# functions flush explicitly when they finish (see _flush_log), so messages
+# surface right after each run rather than at interpreter exit — by which
+# time the stream captured here may already be closed (e.g. under pytest)
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    logger.addHandler(
+        logging.handlers.MemoryHandler(capacity=64, target=logging.StreamHandler())
+    )
+    logger.setLevel(logging.INFO)
+
+
+def _flush_log():
+    """Push any buffered log records out through the handler targets."""
+    for handler in logger.handlers:
+        handler.flush()
+
+def csv_load(file_path=None, dtype=None, usecols=None):
     """
     Load a CSV file into a pandas DataFrame.
     If no file_path is provided, open a file dialog to allow the user to browse for a file.
 
     Args:
         file_path: Path to the CSV file. If None, a file dialog will be shown.
+        dtype: Optional column-to-dtype mapping forwarded to read_csv. Callers
+            that know their schema can pass e.g. float32 for plot-only columns
+            to skip type inference and halve memory.
+        usecols: Optional list of columns to read; the rest are never parsed.
 
     Returns:
         A pandas DataFrame containing the CSV data.
@@ -36,18 +63,32 @@ def csv_load(file_path=None):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file '{file_path}' does not exist.")
 
-    # Load the CSV file into a DataFrame
+    # Load the CSV file into a DataFrame.
+    # The pyarrow engine parses with multiple threads, which is noticeably
+    # faster than the default C engine on the large recorder exports; with an
+    # explicit dtype map the C engine already skips inference, so use that.
     try:
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(
+            file_path,
+            dtype=dtype,
+            usecols=usecols,
+            engine="pyarrow" if dtype is None else "c",
+        )
     except Exception as e:
         raise ValueError(f"Error reading CSV file: {e}")
 
-    return df.copy()
+    # read_csv already returns a DataFrame owned by the caller, so no copy needed
+    return df
 
 
 def csv_save(df, file_path, ensure_folder=False, run_stats=False):
     """
-    Save a pandas DataFrame to a CSV file without modifying the file path.
+    Save a pandas DataFrame; the file extension selects the serializer.
+
+    Intermediate artifacts that are only read back by this pipeline should
+    use '.feather' (or '.pkl'): the columnar binary formats skip the
+    float-to-text encode and re-parse entirely and are typically 5-20x
+    faster than CSV for numeric frames.
 
     Args:
         df: The DataFrame to save.
@@ -63,28 +104,66 @@ def csv_save(df, file_path, ensure_folder=False, run_stats=False):
             os.makedirs(parent_dir, exist_ok=True)
             print(f"Created directory: {parent_dir}")
 
-    # Save the DataFrame
-    df.to_csv(file_path, index=False)
+    if file_path.endswith((".feather", ".ftr")):
+        # Feather requires a default index
+        df.reset_index(drop=True).to_feather(file_path)
+    elif file_path.endswith((".pkl", ".pickle")):
+        df.to_pickle(file_path)
+    else:
+        # Save the DataFrame through a large write buffer; the explicit
+        # lineterminator skips the OS-specific newline translation
+        with open(file_path, "w", newline="", buffering=1 << 20) as f:
+            df.to_csv(f, index=False, lineterminator="\n")
     print(f"File saved to: {file_path}")
 
-    # Optionally calculate statistics
+    # Optionally calculate statistics; pass the in-memory frame so the file
+    # just written is not parsed back in (and binary formats need no reader)
     if run_stats:
-        csv_get_statistics(file_path)
+        csv_get_statistics(df, file_path=file_path)
 
+@lru_cache(maxsize=32)
 def csv_get_files_in_subfolders(folder_path: str, file_extension: str = ".csv") -> List[str]:
     """
     Recursively searches for files with the specified extension in all subfolders.
 
+    The result is memoized per (folder, extension) so reopening the GUI does
+    not repeat the directory walk; call csv_invalidate_file_cache() after
+    writing new files so they are picked up.
+
     :param folder_path: The root folder to start searching.
     :param file_extension: The file extension to look for (e.g., '.csv').
     :return: A list of file paths relative to the root folder.
     """
-    file_paths = []
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            if file.endswith(file_extension):
-                file_paths.append(os.path.relpath(os.path.join(root, file), folder_path))
-    return file_paths
+    # os.scandir exposes the file type straight from the directory entry, so
+    # unlike os.walk no extra stat call is needed per file
+    def _scan(directory):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan(entry.path)
+                elif entry.name.endswith(file_extension):
+                    yield os.path.relpath(entry.path, folder_path)
+
+    return list(_scan(folder_path))
+
+
+def csv_invalidate_file_cache():
+    """
+    Drop the memoized directory listings. Called after steps that create new
+    files (e.g. csv_group_by_date_and_save) so later lookups see them.
+    """
+    csv_get_files_in_subfolders.cache_clear()
+
+def _ensure_datetime(df, column_name, fmt=None):
+    """
+    Convert a column to datetime in place, skipping the conversion entirely
+    if it is already datetime64. Passing an explicit format avoids per-row
+    format inference, and cache=True deduplicates repeated timestamp strings.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(df[column_name]):
+        df[column_name] = pd.to_datetime(df[column_name], format=fmt, cache=True)
+    return df
+
 
 def csv_drop_na(df, *columns):
     """
@@ -96,82 +175,158 @@ def csv_drop_na(df, *columns):
     else:
         return df.dropna()
 
-def csv_group_by_date_and_save(df, output_folder, column_name="DatumZeit"):
+def _write_date_group(date_str, group, output_folder):
+    """
+    Write one date group to its own subfolder. Used as the per-date work unit
+    for the parallel in-memory path of csv_group_by_date_and_save.
+    """
+    date_folder_path = os.path.join(output_folder, date_str)
+    os.makedirs(date_folder_path, exist_ok=True)
+
+    group_file_path = os.path.join(date_folder_path, f"{date_str}.csv")
+    with open(group_file_path, "w", newline="", buffering=1 << 20) as f:
+        group.to_csv(f, index=False, lineterminator="\n")
+    logger.info("Saved data for %s to %s", date_str, group_file_path)
+
+
+def csv_group_by_date_and_save(source, output_folder, column_name="DatumZeit", chunksize=100_000):
     """
-    Groups the DataFrame by the date part of a datetime column, creates a subfolder for each date,
+    Groups CSV data by the date part of a datetime column, creates a subfolder for each date,
     and saves the corresponding data into a CSV file inside that subfolder.
-    If a file already exists, it will be deleted with a notification.
+
+    When given a file path, the input is streamed in chunks so peak memory stays
+    O(chunksize) instead of O(file size); each date file is opened once and
+    chunks are appended to it. An in-memory DataFrame is grouped once and the
+    per-date files are written in parallel.
 
     Args:
-        df: pandas DataFrame containing the data.
+        source: Path to the input CSV file, or an already loaded DataFrame.
         output_folder: The folder where the output subfolders and CSV files will be stored.
         column_name: The name of the column to group by (should be a datetime column).
+        chunksize: Number of rows per chunk when streaming from a file path.
     """
-    # Ensure the column is in datetime format
-    df[column_name] = pd.to_datetime(df[column_name])
-
-    # Group by the date part of the datetime column
-    grouped = df.groupby(df[column_name].dt.date)
-
     # Create output directory if it doesn't exist
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
 
-    # Save each group to a separate CSV file in its own subfolder
-    for date, group in grouped:
-        date_str = date.strftime('%Y-%m-%d')  # Format date as string for folder and filename
-        date_folder_path = os.path.join(output_folder, date_str)
-
-        # Create a subfolder for the date if it doesn't exist
-        if not os.path.exists(date_folder_path):
-            os.makedirs(date_folder_path)
-
-        group_file_path = os.path.join(date_folder_path, f"{date_str}.csv")
-
-        # Check if file already exists and delete it
-        if os.path.exists(group_file_path):
-            os.remove(group_file_path)
-            print(f"Existing file '{group_file_path}' deleted.")
+    # In-memory frame: each date writes to its own file, so the to_csv calls
+    # are independent and can be dispatched to a thread pool (the CSV writer
+    # releases the GIL for most of its work)
+    if not isinstance(source, str):
+        _ensure_datetime(source, column_name)
+        day_key = source[column_name].values.astype("datetime64[D]")
+        # sort=False: each date lands in its own file anyway, so there is no
+        # point paying for a sorted group order
+        # groupby hands back pd.Timestamp keys, not np.datetime64
+        Parallel(n_jobs=-1, prefer="threads")(
+            delayed(_write_date_group)(pd.Timestamp(day).strftime("%Y-%m-%d"), group, output_folder)
+            for day, group in source.groupby(day_key, sort=False)
+        )
+        csv_invalidate_file_cache()
+        _flush_log()
+        return
 
-        # Save the new file
-        group.to_csv(group_file_path, index=False)
-        print(f"Saved data for {date_str} to {group_file_path}")
+    # File path: stream from disk chunk by chunk
+    chunks = pd.read_csv(source, parse_dates=[column_name], chunksize=chunksize)
 
-def csv_get_statistics(file_path, encoding="utf-8"):
+    # One open handle per date; header is written only on first contact
+    handles = {}
+    try:
+        for chunk in chunks:
+            # Ensure the column is in datetime format (no-op if already parsed)
+            _ensure_datetime(chunk, column_name)
+
+            # Group on a datetime64[D] day key: unlike .dt.date this stays a
+            # numpy dtype and avoids allocating one Python date object per row
+            day_key = chunk[column_name].values.astype("datetime64[D]")
+
+            for day, group in chunk.groupby(day_key, sort=False):
+                # groupby hands back pd.Timestamp keys, not np.datetime64
+                date_str = pd.Timestamp(day).strftime("%Y-%m-%d")  # 'YYYY-MM-DD' for folder and filename
+                handle = handles.get(date_str)
+
+                if handle is None:
+                    # First rows for this date: create the subfolder and the file
+                    date_folder_path = os.path.join(output_folder, date_str)
+                    os.makedirs(date_folder_path, exist_ok=True)
+
+                    group_file_path = os.path.join(date_folder_path, f"{date_str}.csv")
+                    handle = open(group_file_path, "w", newline="", buffering=1 << 20)
+                    handles[date_str] = handle
+
+                    group.to_csv(handle, index=False, lineterminator="\n")
+                    logger.info("Saving data for %s to %s", date_str, group_file_path)
+                else:
+                    # Append without repeating the header
+                    group.to_csv(handle, header=False, index=False, lineterminator="\n")
+    finally:
+        for handle in handles.values():
+            handle.close()
+        _flush_log()
+    csv_invalidate_file_cache()
+
+def csv_get_statistics(source, encoding="utf-8", file_path=None):
     """
     Generate and save enhanced statistics for a CSV file, including missing, zero value analysis,
     and specific datetime analysis, to a text file.
 
     Args:
-        file_path: Path to the CSV file.
+        source: Path to the CSV file, or a DataFrame that is already in memory.
+            Passing the DataFrame skips a second full parse of a file the
+            caller has just loaded or produced.
         encoding: Encoding to use when saving the text file. Default is 'utf-8'.
+        file_path: Path used for the report header and the output file name.
+            Required when source is a DataFrame; defaults to source otherwise.
 
     Returns:
         None
     """
-    # Load the CSV file
-    try:
-        df = pd.read_csv(file_path)
-    except Exception as e:
-        print(f"Error loading file {file_path}: {e}")
-        return
-
-    # Initialize the stats report
-    stats_report = [f"=== CSV File Statistics ===\n"]
-    stats_report.append(f"File: {file_path}\n")
-    stats_report.append(f"Number of Rows: {df.shape[0]}\n")
-    stats_report.append(f"Number of Columns: {df.shape[1]}\n\n")
-
-    # Add column types
-    stats_report.append("=== Column Data Types ===\n")
-    stats_report.append(df.dtypes.to_string() + "\n\n")
+    if isinstance(source, pd.DataFrame):
+        if file_path is None:
+            raise ValueError("file_path is required when source is a DataFrame.")
+        df = source
+    else:
+        file_path = source if file_path is None else file_path
+        # Load the CSV file once with the multithreaded pyarrow parser; every
+        # report section below works off this single in-memory frame
+        try:
+            df = pd.read_csv(source, engine="pyarrow")
+        except Exception as e:
+            print(f"Error loading file {source}: {e}")
+            return
+
+    # Initialize the stats report: one formatted block per section instead of
+    # many small appends, which keeps allocations down in batch runs
+    stats_report = [
+        f"=== CSV File Statistics ===\n"
+        f"File: {file_path}\n"
+        f"Number of Rows: {df.shape[0]}\n"
+        f"Number of Columns: {df.shape[1]}\n\n"
+        f"=== Column Data Types ===\n"
+        f"{df.dtypes.to_string()}\n\n"
+    ]
 
     # Add missing and zero value counts
     stats_report.append("=== Missing and Zero Value Analysis ===\n")
-    missing_values = df.isnull().sum()
-    zero_values = (df == 0).sum(numeric_only=True)
-    combined_stats = pd.DataFrame({"Missing Values": missing_values, "Zero Values": zero_values})
-    stats_report.append(combined_stats.to_string() + "\n\n")
+    # Compute both reductions from one contiguous scan of the numeric block
+    # instead of separate isnull() and (df == 0) passes over the whole frame
+    numeric_df = df.select_dtypes(include="number")
+    numeric_arr = numeric_df.to_numpy(copy=False)
+    numeric_missing = pd.Series(np.isnan(numeric_arr).sum(axis=0), index=numeric_df.columns)
+    zero_values = pd.Series((numeric_arr == 0).sum(axis=0), index=numeric_df.columns)
+
+    # Non-numeric columns still need the generic isnull() path
+    other_cols = df.columns.difference(numeric_df.columns)
+    missing_values = pd.concat([numeric_missing, df[other_cols].isnull().sum()]).reindex(df.columns)
+
+    # Format the table straight from the arrays instead of allocating a
+    # DataFrame just to call to_string() on it
+    zero_lookup = zero_values.reindex(df.columns, fill_value=0)
+    name_width = max([len(str(c)) for c in df.columns] + [10])
+    lines = [f"{'':<{name_width}} {'Missing Values':>14} {'Zero Values':>12}"]
+    for name, missing, zero in zip(df.columns, missing_values.to_numpy(), zero_lookup.to_numpy()):
+        lines.append(f"{str(name):<{name_width}} {int(missing):>14d} {int(zero):>12d}")
+    stats_report.append("\n".join(lines) + "\n\n")
 
     # Add statistics for numerical columns
     stats_report.append("=== Numerical Column Statistics ===\n")
@@ -186,7 +341,19 @@ def csv_get_statistics(file_path, encoding="utf-8"):
     if not categorical_columns.empty:
         for col in categorical_columns.columns:
             stats_report.append(f"Top Values in '{col}':\n")
-            stats_report.append(categorical_columns[col].value_counts().head(5).to_string() + "\n\n")
+            # Count on integer category codes (bincount) and pick the top 5
+            # with O(n) argpartition instead of the full sort value_counts does
+            cat = categorical_columns[col].astype("category")
+            codes = cat.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(cat.cat.categories))
+            k = min(5, len(counts))
+            if k == 0:
+                stats_report.append("No non-null values.\n\n")
+                continue
+            top_idx = np.argpartition(-counts, k - 1)[:k]
+            top_idx = top_idx[np.argsort(-counts[top_idx])]
+            top_counts = pd.Series(counts[top_idx], index=cat.cat.categories[top_idx])
+            stats_report.append(top_counts.to_string() + "\n\n")
     else:
         stats_report.append("No categorical columns found.\n\n")
 
@@ -194,15 +361,19 @@ def csv_get_statistics(file_path, encoding="utf-8"):
     if 'DatumZeit' in df.columns:
         stats_report.append("=== DatumZeit Column Analysis ===\n")
         try:
-            df['DatumZeit'] = pd.to_datetime(df['DatumZeit'], errors='coerce')  # Parse as datetime
-            if df['DatumZeit'].isnull().all():
+            # Parse into a local series so a caller-supplied DataFrame is
+            # never modified as a side effect of generating the report
+            datum = pd.to_datetime(df['DatumZeit'], errors='coerce')
+            if datum.isnull().all():
                 stats_report.append("Failed to parse DatumZeit column as datetime.\n\n")
             else:
-                stats_report.append(f"Total non-null datetime entries: {df['DatumZeit'].notnull().sum()}\n")
-                stats_report.append(f"Earliest timestamp: {df['DatumZeit'].min()}\n")
-                stats_report.append(f"Latest timestamp: {df['DatumZeit'].max()}\n")
-                stats_report.append("Entries per day:\n")
-                stats_report.append(df['DatumZeit'].dt.date.value_counts().to_string() + "\n\n")
+                stats_report.append(
+                    f"Total non-null datetime entries: {datum.notnull().sum()}\n"
+                    f"Earliest timestamp: {datum.min()}\n"
+                    f"Latest timestamp: {datum.max()}\n"
+                    f"Entries per day:\n"
+                    f"{datum.dt.date.value_counts().to_string()}\n\n"
+                )
         except Exception as e:
             stats_report.append(f"Error processing DatumZeit column: {e}\n\n")
     else:
@@ -211,8 +382,11 @@ def csv_get_statistics(file_path, encoding="utf-8"):
     # Save statistics to a text file
     output_file = f"{os.path.splitext(file_path)[0]}_statistics.txt"
     try:
-        with open(output_file, "w", encoding=encoding) as f:  # Specify encoding here
-            f.write("".join(stats_report))
+        # Write the fragments one by one through a large buffer instead of
+        # joining them into one big intermediate string first
+        with open(output_file, "w", encoding=encoding, buffering=1 << 20) as f:
+            for fragment in stats_report:
+                f.write(fragment)
         print(f"Statistics saved to {output_file}")
     except Exception as e:
         print(f"Error writing statistics to file: {e}")
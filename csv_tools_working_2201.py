@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import os
@@ -41,9 +42,10 @@ def csv_load(file_path=None):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file '{file_path}' does not exist.")
 
-    # Load the CSV file into a DataFrame
+    # Load the CSV file into a DataFrame; it is already a fresh object,
+    # so the defensive copy would only double peak memory during load
     df = pd.read_csv(file_path)
-    return df.copy()
+    return df
 
 
 
@@ -101,6 +103,17 @@ def csv_save(df, file_path, ensure_folder=False, suffixes=None, run_stats=False)
 
 
 
+def _ensure_datetime(df, column_name, fmt=None):
+    """
+    Convert a column to datetime in place, skipping the conversion entirely
+    if it is already datetime64. Passing an explicit format avoids per-row
+    format inference, and cache=True deduplicates repeated timestamp strings.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(df[column_name]):
+        df[column_name] = pd.to_datetime(df[column_name], format=fmt, cache=True)
+    return df
+
+
 def csv_drop_na(df, *columns):
     """
     Remove rows with NA values in the specified columns.
@@ -120,11 +133,15 @@ def csv_get_datetime_stats(df, column_name="DatumZeit"):
     if column_name not in df.columns:
         raise ValueError(f"Column '{column_name}' does not exist in the DataFrame.")
 
-    df[column_name] = pd.to_datetime(df[column_name])  # Ensure datetime format
+    # Work on a local datetime view: skip conversion when already parsed and
+    # avoid overwriting (and reallocating) the column in the caller's DataFrame
+    col = df[column_name]
+    if not pd.api.types.is_datetime64_any_dtype(col):
+        col = pd.to_datetime(col, cache=True)
 
     # Calculate the statistics
-    earliest = df[column_name].min()
-    latest = df[column_name].max()
+    earliest = col.min()
+    latest = col.max()
     date_range = latest - earliest
     num_rows = len(df)  # Get the number of rows
 
@@ -174,8 +191,12 @@ def csv_filter_by_day(df, column_name, target_date):
     Keep only rows where the date matches the target date.
     Raise a ValueError if no matching rows are found.
     """
-    df[column_name] = pd.to_datetime(df[column_name])  # Ensure datetime format
-    filtered_df = df[df[column_name].dt.date == datetime.strptime(target_date, '%Y-%m-%d').date()]
+    _ensure_datetime(df, column_name)  # Ensure datetime format (no-op if already parsed)
+    # Compare on datetime64[D] values: a single vectorized int64 comparison
+    # instead of materializing one Python date object per row via .dt.date
+    target = np.datetime64(target_date, 'D')
+    mask = df[column_name].values.astype('datetime64[D]') == target
+    filtered_df = df[mask]
     if filtered_df.empty:
         raise ValueError(f"No rows found for the date '{target_date}'.")
     return filtered_df
@@ -185,10 +206,23 @@ def csv_filter_by_datetime_range(df, column_name, start_datetime, end_datetime):
     Keep only rows where the datetime is within the specified range.
     Raise a ValueError if no matching rows are found.
     """
-    df[column_name] = pd.to_datetime(df[column_name])  # Ensure datetime format
-    start_datetime = pd.to_datetime(start_datetime)
-    end_datetime = pd.to_datetime(end_datetime)
-    filtered_df = df[(df[column_name] >= start_datetime) & (df[column_name] <= end_datetime)]
+    _ensure_datetime(df, column_name)  # Ensure datetime format (no-op if already parsed)
+
+    # Accept already-parsed Timestamps without running them through
+    # pd.to_datetime again on every call
+    if not isinstance(start_datetime, pd.Timestamp):
+        start_datetime = pd.to_datetime(start_datetime, cache=True)
+    if not isinstance(end_datetime, pd.Timestamp):
+        end_datetime = pd.to_datetime(end_datetime, cache=True)
+
+    if df[column_name].is_monotonic_increasing:
+        # Sorted timestamps: binary-search the bounds instead of scanning all rows
+        values = df[column_name].values
+        lo = values.searchsorted(start_datetime.to_datetime64(), side='left')
+        hi = values.searchsorted(end_datetime.to_datetime64(), side='right')
+        filtered_df = df.iloc[lo:hi]
+    else:
+        filtered_df = df[(df[column_name] >= start_datetime) & (df[column_name] <= end_datetime)]
     if filtered_df.empty:
         raise ValueError(f"No rows found in the range {start_datetime} to {end_datetime}.")
     return filtered_df
@@ -204,8 +238,8 @@ def csv_group_by_date_and_save(df, output_folder, column_name="DatumZeit"):
         output_folder: The folder where the output subfolders and CSV files will be stored.
         column_name: The name of the column to group by (should be a datetime column).
     """
-    # Ensure the column is in datetime format
-    df[column_name] = pd.to_datetime(df[column_name])
+    # Ensure the column is in datetime format (no-op if already parsed)
+    _ensure_datetime(df, column_name)
 
     # Group by the date part of the datetime column
     grouped = df.groupby(df[column_name].dt.date)
@@ -215,22 +249,21 @@ def csv_group_by_date_and_save(df, output_folder, column_name="DatumZeit"):
         os.makedirs(output_folder)
 
     # Save each group to a separate CSV file in its own subfolder
+    dirs_created = set()
     for date, group in grouped:
         date_str = date.strftime('%Y-%m-%d')  # Format date as string for folder and filename
         date_folder_path = os.path.join(output_folder, date_str)
 
-        # Create a subfolder for the date if it doesn't exist
-        if not os.path.exists(date_folder_path):
-            os.makedirs(date_folder_path)
+        # Create a subfolder for the date if it doesn't exist (one makedirs per date,
+        # instead of an exists() stat on every iteration)
+        if date_folder_path not in dirs_created:
+            os.makedirs(date_folder_path, exist_ok=True)
+            dirs_created.add(date_folder_path)
 
         group_file_path = os.path.join(date_folder_path, f"{date_str}.csv")
 
-        # Check if file already exists and delete it
-        if os.path.exists(group_file_path):
-            os.remove(group_file_path)
-            print(f"Existing file '{group_file_path}' deleted.")
-
-        # Save the new file
+        # Save the new file; to_csv opens in 'w' mode, which already truncates
+        # any existing file, so no exists()/remove() dance is needed
         group.to_csv(group_file_path, index=False)
         print(f"Saved data for {date_str} to {group_file_path}")
 
@@ -7,22 +7,144 @@ Description: Provides utilities for geospatial calculations and data transformat
 including coordinate projections and distance computations.
 """
 
+import math
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
 
 import numpy as np
 import pandas as pd
+from numba import njit, prange
 from pyproj import Transformer
+from pyproj.transformer import AreaOfInterest
 from scipy.ndimage import gaussian_filter1d
 from scipy.signal import savgol_filter
 
 
-def data_convert_to_planar(df, config):
+# Bounding box of the German rail network the recordings come from. Handing
+# PROJ this area up front lets it choose the best datum-shift operation once
+# at construction instead of resolving candidates at transform time.
+_AREA_OF_INTEREST = AreaOfInterest(
+    west_lon_degree=5.0,
+    south_lat_degree=47.0,
+    east_lon_degree=16.0,
+    north_lat_degree=56.0,
+)
+
+
+@lru_cache(maxsize=32)
+def _get_transformer(src, dst, always_xy=True):
     """
-    Add UTM coordinates to the DataFrame based on latitude and longitude using vectorized operations.
+    Build (and cache) a pyproj Transformer. Constructing one costs hundreds of
+    milliseconds, which used to be paid again for every subset, while the
+    cached instance is free after the first call.
+    """
+    return Transformer.from_crs(
+        src, dst, always_xy=always_xy, area_of_interest=_AREA_OF_INTEREST
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _keep_mask(coords, min_d2):
+    """
+    Compiled inner loop of the minimum-distance filter: mark every point that
+    lies at least sqrt(min_d2) away from the previously retained point.
+    Squared distances avoid the sqrt entirely.
+    """
+    n = coords.shape[0]
+    mask = np.zeros(n, np.bool_)
+    mask[0] = True
+    last_x, last_y = coords[0, 0], coords[0, 1]
+    for i in range(1, n):
+        dx = coords[i, 0] - last_x
+        dy = coords[i, 1] - last_y
+        if dx * dx + dy * dy >= min_d2:
+            mask[i] = True
+            last_x, last_y = coords[i, 0], coords[i, 1]
+    return mask
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _block_keep_mask(coords, min_d2, block):
+    """
+    Speculative parallel pass of the minimum-distance filter: each block of
+    rows runs the walk independently, anchored at its own first point.
+    Block boundaries are fixed up afterwards by _stitch_block_boundaries.
+    """
+    n = coords.shape[0]
+    mask = np.zeros(n, np.bool_)
+    nblocks = (n + block - 1) // block
+    for b in prange(nblocks):
+        start = b * block
+        end = min(start + block, n)
+        mask[start] = True
+        last_x, last_y = coords[start, 0], coords[start, 1]
+        for i in range(start + 1, end):
+            dx = coords[i, 0] - last_x
+            dy = coords[i, 1] - last_y
+            if dx * dx + dy * dy >= min_d2:
+                mask[i] = True
+                last_x, last_y = coords[i, 0], coords[i, 1]
+    return mask
+
+
+@njit(cache=True, fastmath=True)
+def _stitch_block_boundaries(coords, mask, min_d2, block):
+    """
+    Sequential fix-up after _block_keep_mask: replay each block with the true
+    last-retained point carried over from the previous block. As soon as the
+    replay retains a point the speculative pass also retained, both walks
+    share the same state and the rest of the block is already correct.
+    """
+    n = coords.shape[0]
+    for start in range(block, n, block):
+        end = min(start + block, n)
+
+        # Last retained point before this block (block 0 always keeps row 0)
+        j = start - 1
+        while not mask[j]:
+            j -= 1
+        last_x, last_y = coords[j, 0], coords[j, 1]
+
+        for i in range(start, end):
+            speculative = mask[i]
+            dx = coords[i, 0] - last_x
+            dy = coords[i, 1] - last_y
+            keep = dx * dx + dy * dy >= min_d2
+            mask[i] = keep
+            if keep:
+                last_x, last_y = coords[i, 0], coords[i, 1]
+                if speculative:
+                    break  # walks converged, rest of the block stands
+    return mask
+
+
+def data_warmup():
+    """
+    Compile every Numba kernel and build the cached Transformer up front.
+
+    Called once before the per-subset loop so that JIT compilation latency
+    (around a second per kernel on a cold cache) is paid at startup instead
+    of inside the first subset's processing time.
+    """
+    coords = np.zeros((4, 2))
+    ones = np.ones(4)
+    _keep_mask(coords, 1.0)
+    _block_keep_mask(coords, 1.0, 2)
+    _stitch_block_boundaries(coords, _keep_mask(coords, 1.0), 1.0, 2)
+    _keep_mask_ordered(coords, np.arange(4), 1.0)
+    _heading_and_yaw(coords, ones)
+    _get_transformer("EPSG:4326", "EPSG:32633", True)
+
+
+def data_pick_smoothing_columns(df, config):
+    """
+    Decide which latitude/longitude columns the planar conversion should use.
     Prioritize smoothed columns if available, otherwise use the original columns.
 
-    If multiple smoothed columns are available, allow the user to select one via a GUI.
+    If multiple smoothed columns are available, allow the user to select one
+    via a GUI. Keeping the Tk code here (and out of the numerical conversion)
+    means the picker runs once before a batch, not once per subset.
 
     Parameters
     ----------
@@ -33,15 +155,16 @@ def data_convert_to_planar(df, config):
 
     Returns
     -------
-    pd.DataFrame
-        DataFrame with added planar coordinates (x, y) and a column for the selected smoothing method.
+    tuple of (str, str, str)
+        The latitude column, longitude column and the selected smoothing method.
     """
-    # Identify smoothed latitude and longitude columns
-    smoothed_lat_columns = [
-        col for col in df.columns if col.startswith("GPS_lat_smooth_")
-    ]
+    # Identify smoothed latitude and longitude columns: the startswith match
+    # runs in C inside pandas rather than looping Python-side over the names
+    smooth_prefix = "GPS_lat_smooth_"
+    smoothed_lat_columns = df.columns[df.columns.str.startswith(smooth_prefix)].tolist()
+    smoothed_methods = [col[len(smooth_prefix):] for col in smoothed_lat_columns]
     smoothed_lon_columns = [
-        col.replace("GPS_lat", "GPS_lon") for col in smoothed_lat_columns
+        col.replace("GPS_lat", "GPS_lon", 1) for col in smoothed_lat_columns
     ]
 
     # Initialize selected method
@@ -54,7 +177,7 @@ def data_convert_to_planar(df, config):
         root.title("Select Smoothing Algorithm")
 
         selected_method_var = tk.StringVar(
-            value=smoothed_lat_columns[0].split("_")[-1]
+            value=smoothed_methods[0]
         )  # Default to the first method
 
         def submit():
@@ -65,7 +188,7 @@ def data_convert_to_planar(df, config):
         dropdown = ttk.Combobox(
             root,
             textvariable=selected_method_var,
-            values=[col.split("_")[-1] for col in smoothed_lat_columns],
+            values=smoothed_methods,
             state="readonly",
         )
         dropdown.pack(pady=10)
@@ -91,7 +214,7 @@ def data_convert_to_planar(df, config):
         # Use the single available smoothed column
         lat_col = smoothed_lat_columns[0]
         lon_col = smoothed_lon_columns[0]
-        selected_method = lat_col.split("_")[-1]
+        selected_method = smoothed_methods[0]
         print(f"Automatically using smoothed columns: {lat_col}, {lon_col}")
     else:
         # Fall back to raw data columns specified in config
@@ -99,13 +222,53 @@ def data_convert_to_planar(df, config):
         lon_col = config["lon_col"]
         print(f"No smoothed GPS columns found. Using raw data columns: {lat_col}, {lon_col}")
 
-    # Transformer: WGS84 (EPSG:4326) to UTM zone 33N (EPSG:32633)
-    transformer = Transformer.from_crs("EPSG:4326", "EPSG:32633", always_xy=True)
-    x, y = transformer.transform(df[lon_col].values, df[lat_col].values)
+    return lat_col, lon_col, selected_method
+
+
+def data_convert_to_planar(df, config, columns=None):
+    """
+    Add UTM coordinates to the DataFrame based on latitude and longitude using vectorized operations.
+
+    This is the pure numerical half of the conversion: no GUI is involved.
+    The column choice either comes in via `columns` (the result of
+    data_pick_smoothing_columns, picked once for a whole batch) or is
+    resolved on the fly for backwards compatibility.
 
-    # Add planar coordinates to the DataFrame
-    df["x"] = x
-    df["y"] = y
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input DataFrame with GPS data.
+    config : dict
+        Configuration dictionary with column names and transformation settings.
+    columns : tuple of (str, str, str), optional
+        (lat_col, lon_col, selected_method) as returned by
+        data_pick_smoothing_columns. If None, the picker is called here.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with added planar coordinates (x, y) and a column for the selected smoothing method.
+    """
+    if columns is None:
+        columns = data_pick_smoothing_columns(df, config)
+    lat_col, lon_col, selected_method = columns
+
+    # Transformer: WGS84 (EPSG:4326) to UTM zone 33N (EPSG:32633), cached
+    # across calls so the per-subset loop pays the construction cost only once
+    transformer = _get_transformer("EPSG:4326", "EPSG:32633", True)
+
+    # Hand pyproj contiguous float64 buffers we own and let it transform them
+    # in place: the input arrays double as the output, so no second pair of
+    # N-point arrays is allocated (the copy() keeps the pandas columns intact)
+    lon = df[lon_col].to_numpy(dtype=np.float64).copy()
+    lat = df[lat_col].to_numpy(dtype=np.float64).copy()
+    transformer.transform(lon, lat, inplace=True)
+
+    # Keep float64: at 7-digit northings float32 quantizes to ~0.5 m, which
+    # corrupts the meter-scale distance filter and adds degrees of jitter to
+    # headings computed from consecutive points downstream
+    df["x"] = lon
+    df["y"] = lat
 
     # Add the selected smoothing method to the DataFrame
     df["selected_smoothing_method"] = selected_method
@@ -113,6 +276,47 @@ def data_convert_to_planar(df, config):
     return df
 
 
+def data_convert_to_planar_batch(dfs, lat_col, lon_col):
+    """
+    Add UTM coordinates to several DataFrames with a single pyproj call.
+
+    The lon/lat columns of all frames are concatenated, the combined batch is
+    transformed once, and the result slices are written back per frame. PROJ's
+    per-call overhead is therefore paid once instead of once per subset, which
+    matters when many small subset files are processed in a row.
+
+    Parameters
+    ----------
+    dfs : list of pd.DataFrame
+        The input DataFrames with GPS data.
+    lat_col, lon_col : str
+        Names of the latitude and longitude columns.
+
+    Returns
+    -------
+    list of pd.DataFrame
+        The same DataFrames with added planar coordinates (x, y).
+    """
+    if not dfs:
+        return dfs
+
+    transformer = _get_transformer("EPSG:4326", "EPSG:32633", True)
+
+    lon_all = np.concatenate([df[lon_col].to_numpy(dtype=np.float64) for df in dfs])
+    lat_all = np.concatenate([df[lat_col].to_numpy(dtype=np.float64) for df in dfs])
+    x_all, y_all = transformer.transform(lon_all, lat_all)
+
+    # Write the batch result back slice by slice
+    offset = 0
+    for df in dfs:
+        n = len(df)
+        df["x"] = x_all[offset:offset + n]
+        df["y"] = y_all[offset:offset + n]
+        offset += n
+
+    return dfs
+
+
 def data_filter_points_by_distance(df, config):
     """
     Filter points by a minimum distance using columns and settings from config.
@@ -130,8 +334,8 @@ def data_filter_points_by_distance(df, config):
     Returns
     -------
     pd.DataFrame
-        Modified DataFrame with points spaced by at least the minimum distance
-        and a new column 'min_distance' indicating the distance used for filtering.
+        Modified DataFrame with points spaced by at least the minimum distance;
+        the distance used is recorded in df.attrs["min_distance"].
     """
     x_col = config["x_col"]
     y_col = config["y_col"]
@@ -148,28 +352,116 @@ def data_filter_points_by_distance(df, config):
                 f"Missing column '{col}'. Ensure planar coordinates exist before calling this function."
             )
 
-    # Extract coordinates as a NumPy array
-    coords = df[[x_col, y_col]].to_numpy()
-
-    # Initialize list of retained indices
-    retained_indices = [0]  # Always keep the first point
-    last_retained_point = coords[0]  # Start with the first point
-
-    # Iterate through the remaining points
-    for i in range(1, len(coords)):
-        distance = np.linalg.norm(coords[i] - last_retained_point)  # Distance to last retained point
-        if distance >= min_distance:
-            retained_indices.append(i)  # Retain the current point
-            last_retained_point = coords[i]  # Update the last retained point
+    # Extract coordinates as a contiguous NumPy array for the compiled loop
+    coords = np.ascontiguousarray(df[[x_col, y_col]].to_numpy())
+
+    # The sequential dependency on the last retained point rules out plain
+    # vectorization, so the loop runs in the Numba kernel instead of Python.
+    # Large trajectories take the block-parallel kernel whose boundaries are
+    # stitched sequentially afterwards; small ones stay on the plain walk.
+    min_d2 = min_distance * min_distance
+    block = 65_536
+    if len(coords) >= 4 * block:
+        mask = _block_keep_mask(coords, min_d2, block)
+        mask = _stitch_block_boundaries(coords, mask, min_d2, block)
+    else:
+        mask = _keep_mask(coords, min_d2)
 
     # Filter the DataFrame
-    df = df.iloc[retained_indices].reset_index(drop=True)
+    df = df.iloc[mask].reset_index(drop=True)
 
-    # Add min_distance as a new column for all rows
-    df['min_distance'] = min_distance
+    # Record the filter distance as frame metadata instead of broadcasting a
+    # constant into a full-length column (8 bytes per row in memory and in
+    # every CSV written afterwards). Note: attrs survive iloc/copy but not
+    # every pandas operation, so read it back right after filtering.
+    df.attrs["min_distance"] = min_distance
 
     return df
 
+def _spread_bits(v):
+    """
+    Spread the lower 32 bits of each uint64 so a zero bit sits between every
+    input bit (the standard magic-number Morton expansion).
+    """
+    v = (v | (v << 16)) & np.uint64(0x0000FFFF0000FFFF)
+    v = (v | (v << 8)) & np.uint64(0x00FF00FF00FF00FF)
+    v = (v | (v << 4)) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    v = (v | (v << 2)) & np.uint64(0x3333333333333333)
+    v = (v | (v << 1)) & np.uint64(0x5555555555555555)
+    return v
+
+
+@njit(cache=True, fastmath=True)
+def _keep_mask_ordered(coords, order, min_d2):
+    """
+    Same walk as _keep_mask, but visiting the points in the given order
+    (e.g. sorted along a Z-order curve) instead of row order.
+    """
+    mask = np.zeros(coords.shape[0], np.bool_)
+    first = order[0]
+    mask[first] = True
+    last_x, last_y = coords[first, 0], coords[first, 1]
+    for k in range(1, order.shape[0]):
+        i = order[k]
+        dx = coords[i, 0] - last_x
+        dy = coords[i, 1] - last_y
+        if dx * dx + dy * dy >= min_d2:
+            mask[i] = True
+            last_x, last_y = coords[i, 0], coords[i, 1]
+    return mask
+
+
+def data_filter_points_by_distance_morton(df, config):
+    """
+    Thin a point cloud by a minimum distance using a Z-order (Morton) sort.
+
+    The sequential filter in data_filter_points_by_distance assumes the rows
+    already follow the trajectory. When the points arrive in random order,
+    sorting them along a Z-order curve first places spatial neighbours next to
+    each other, so one adjacent-pair walk thins the cloud in O(n log n)
+    instead of comparing every pair.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input DataFrame containing coordinates.
+    config : dict
+        Dictionary containing configuration values:
+            - "x_col": Column name for x-coordinates.
+            - "y_col": Column name for y-coordinates.
+            - "min_distance": Minimum distance to retain a point.
+
+    Returns
+    -------
+    pd.DataFrame
+        Modified DataFrame with points spaced by at least the minimum distance.
+    """
+    x_col = config["x_col"]
+    y_col = config["y_col"]
+    min_distance = config["min_distance"]
+
+    if df.empty or min_distance <= 0:
+        return df
+
+    for col in [x_col, y_col]:
+        if col not in df.columns:
+            raise ValueError(
+                f"Missing column '{col}'. Ensure planar coordinates exist before calling this function."
+            )
+
+    coords = np.ascontiguousarray(df[[x_col, y_col]].to_numpy(dtype=np.float64))
+
+    # Quantize to min_distance cells and interleave the bits into Morton codes
+    x_q = ((coords[:, 0] - coords[:, 0].min()) / min_distance).astype(np.uint64)
+    y_q = ((coords[:, 1] - coords[:, 1].min()) / min_distance).astype(np.uint64)
+    morton = _spread_bits(x_q) | (_spread_bits(y_q) << np.uint64(1))
+
+    order = np.argsort(morton)
+    mask = _keep_mask_ordered(coords, order, min_distance * min_distance)
+
+    return df.iloc[mask].reset_index(drop=True)
+
+
 def parse_time_and_compute_dt(df, datetime_col):
     """
     Parse the given datetime column as pandas datetime and compute delta time (in seconds).
@@ -191,8 +483,16 @@ def parse_time_and_compute_dt(df, datetime_col):
     # Convert the column to datetime
     df[datetime_col] = pd.to_datetime(df[datetime_col])
 
-    # Compute the difference in timestamps
-    df["dt"] = df[datetime_col].diff().dt.total_seconds()
+    # Compute the difference on the int64 nanosecond values directly; the
+    # Series.diff().dt.total_seconds() route would build a whole Timedelta
+    # Series just to throw it away again. The explicit [ns] conversion
+    # matters: pandas >= 2.0 may parse timestamps as datetime64[s]/[us],
+    # which would put the int64 view off by factors of 1e3-1e9.
+    ts = df[datetime_col].to_numpy(dtype="datetime64[ns]").view("i8")
+    dt = np.empty(len(ts), dtype=np.float64)
+    dt[0] = np.nan
+    dt[1:] = (ts[1:] - ts[:-1]) / 1e9
+    df["dt"] = dt
 
     return df
 
@@ -226,16 +526,17 @@ def data_compute_heading_from_xy(df, config):
     if x_col not in df.columns or y_col not in df.columns:
         raise ValueError(f"Required columns '{x_col}' and/or '{y_col}' not found in DataFrame.")
 
-    # Calculate differences
-    dx = df[x_col].diff()
-    dy = df[y_col].diff()
+    # Calculate differences on the raw ndarrays: np.diff skips the Series
+    # allocation and index alignment that each pandas .diff() call pays
+    x = df[x_col].to_numpy(dtype=np.float64)
+    y = df[y_col].to_numpy(dtype=np.float64)
+    dx = np.diff(x)
+    dy = np.diff(y)
 
-    # Compute heading in radians
-    heading_rad = np.arctan2(dy, dx)  # range: [-pi, pi]
-
-    # Convert to degrees and shift to [0, 360)
-    heading_deg = np.degrees(heading_rad)
-    heading_deg = (heading_deg + 360) % 360
+    # Heading in degrees shifted to [0, 360), with a NaN head so the column
+    # aligns like the old Series.diff() result
+    heading_deg = np.full(x.shape[0], np.nan)
+    heading_deg[1:] = (np.degrees(np.arctan2(dy, dx)) + 360) % 360
 
     # Assign to the specified column
     df[heading_col] = heading_deg
@@ -276,21 +577,169 @@ def data_compute_yaw_rate_from_heading(df, config):
     if heading_col not in df.columns or dt_col not in df.columns:
         raise ValueError(f"Required columns '{heading_col}' and/or '{dt_col}' not found in DataFrame.")
 
-    # 1. Heading difference
-    heading_diff = df[heading_col].diff()
+    # Work on the raw ndarrays: each pandas .diff()/modulo step would allocate
+    # a full Series with index overhead, the in-place numpy ops below do not
+    heading = df[heading_col].to_numpy(dtype=np.float64)
+    dt_vals = df[dt_col].to_numpy(dtype=np.float64)
+
+    # 1. Heading difference (NaN head, like Series.diff)
+    diff = np.empty_like(heading)
+    diff[0] = np.nan
+    np.subtract(heading[1:], heading[:-1], out=diff[1:])
 
-    # 2. Wrap to [-180, 180]
-    heading_diff = (heading_diff + 180) % 360 - 180
+    # 2. Wrap to [-180, 180] in place
+    diff += 180
+    np.mod(diff, 360, out=diff)
+    diff -= 180
 
     # 3. Divide by dt => degrees/second
-    dt_vals = df[dt_col]
-    yaw_rate_deg_s = heading_diff / dt_vals
+    diff /= dt_vals
 
     # 4. Assign to a fixed column name
-    df["yaw_rate_deg_s"] = yaw_rate_deg_s
+    df["yaw_rate_deg_s"] = diff
+
+    return df
+
+@njit(cache=True)
+def _heading_and_yaw(xy, dt):
+    """
+    Fused kernel: heading in [0, 360) and yaw rate in deg/s in one pass over
+    an (N, 2) coordinate block and dt. Doing diff, arctan2, wrap and division
+    in a single loop moves each array through memory once instead of
+    allocating five intermediates, and the row-major x/y pairs land in the
+    same cache line (same layout the distance-filter kernels use).
+    The coordinates must stay float64: float32 spacing at UTM northings
+    (~5.8e6 m) is 0.25-0.5 m, which wrecks headings computed from ~1 m
+    segments. float32 *outputs* are plenty for degree-scale signals.
+    No fastmath here: the NaN head rows are load-bearing sentinels.
+    """
+    n = xy.shape[0]
+    heading = np.empty(n, np.float32)
+    yaw_rate = np.empty(n, np.float32)
+    heading[0] = np.nan
+    yaw_rate[0] = np.nan
+    for i in range(1, n):
+        dx = xy[i, 0] - xy[i - 1, 0]
+        dy = xy[i, 1] - xy[i - 1, 1]
+        h = math.degrees(math.atan2(dy, dx))
+        if h < 0.0:
+            h += 360.0
+        heading[i] = h
+        diff = (h - heading[i - 1] + 180.0) % 360.0 - 180.0
+        yaw_rate[i] = diff / dt[i]
+    return heading, yaw_rate
+
+
+def data_compute_heading_and_yaw_rate(df, config):
+    """
+    Compute heading and yaw rate together in a single fused pass.
+
+    Equivalent to running data_compute_heading_from_xy followed by
+    data_compute_yaw_rate_from_heading, but the compiled kernel touches the
+    x/y/dt columns only once, which roughly quarters the memory traffic of
+    the two separate pandas pipelines.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame containing planar coordinates and a dt column.
+    config : dict
+        Configuration dictionary containing keys:
+            - "x_col": Column name for the x-coordinate (default "x").
+            - "y_col": Column name for the y-coordinate (default "y").
+            - "dt_col": Column name with time deltas in seconds (default "dt").
+            - "heading_col": Name of the new heading column (default "heading_deg").
+
+    Returns
+    -------
+    pd.DataFrame
+        The modified DataFrame with the heading column and 'yaw_rate_deg_s'.
+    """
+    x_col = config.get("x_col", "x")
+    y_col = config.get("y_col", "y")
+    dt_col = config.get("dt_col", "dt")
+    heading_col = config.get("heading_col", "heading_deg")
+
+    for col in (x_col, y_col, dt_col):
+        if col not in df.columns:
+            raise ValueError(f"Required column '{col}' not found in DataFrame.")
+
+    # One C-contiguous (N, 2) float64 block: both coordinates of a row share
+    # a cache line, which is how the kernel reads them (float64 because UTM
+    # magnitudes leave float32 only ~0.5 m of resolution)
+    xy = np.ascontiguousarray(df[[x_col, y_col]].to_numpy(dtype=np.float64))
+    heading, yaw_rate = _heading_and_yaw(
+        xy,
+        df[dt_col].to_numpy(dtype=np.float64),
+    )
+    df[heading_col] = heading
+    df["yaw_rate_deg_s"] = yaw_rate
 
     return df
 
+
+def process_gps_pipeline(lat, lon, ts, min_distance):
+    """
+    Fused pipeline over raw GPS arrays: planar conversion, distance filter,
+    dt, heading and yaw rate in one pass.
+
+    The stepwise functions (data_convert_to_planar →
+    data_filter_points_by_distance → parse_time_and_compute_dt →
+    data_compute_heading_and_yaw_rate) each rewalk the DataFrame and
+    allocate intermediate columns, so the chain is memory-bandwidth-bound.
+    Deriving everything here from the same planar/dt arrays moves a
+    fraction of the bytes and skips the per-step DataFrame bookkeeping.
+
+    Parameters
+    ----------
+    lat, lon : np.ndarray
+        WGS84 coordinates in degrees.
+    ts : np.ndarray
+        Timestamps as datetime64[ns].
+    min_distance : float
+        Minimum distance (meters) from the last kept point, same semantics
+        as data_filter_points_by_distance.
+
+    Returns
+    -------
+    dict
+        Arrays over the *kept* points: "keep" (mask over the input rows),
+        "x", "y", "dt", "heading_deg", "yaw_rate_deg_s".
+    """
+    transformer = _get_transformer("EPSG:4326", "EPSG:32633", True)
+
+    # np.array copies, so the in-place transform cannot clobber caller data
+    x = np.array(lon, dtype=np.float64)
+    y = np.array(lat, dtype=np.float64)
+    transformer.transform(x, y, inplace=True)
+
+    # One (N, 2) coordinate block feeds both kernels; distance filtering with
+    # the same walk semantics as the stepwise filter (distance is measured
+    # from the last *kept* point, not the previous row)
+    coords = np.column_stack((x, y))
+    keep = _keep_mask(coords, min_distance * min_distance)
+    coords = coords[keep]
+
+    # dt in seconds from the int64-nanosecond view of the kept timestamps;
+    # the explicit [ns] conversion guards against datetime64[s]/[us] input
+    # (pandas >= 2.0 may parse to coarser units)
+    ts_ns = np.asarray(ts, dtype="datetime64[ns]").view("i8")[keep]
+    dt = np.empty(ts_ns.shape[0], dtype=np.float64)
+    dt[0] = np.nan
+    dt[1:] = (ts_ns[1:] - ts_ns[:-1]) / 1e9
+
+    heading, yaw_rate = _heading_and_yaw(np.ascontiguousarray(coords), dt)
+
+    return {
+        "keep": keep,
+        "x": coords[:, 0],
+        "y": coords[:, 1],
+        "dt": dt,
+        "heading_deg": heading,
+        "yaw_rate_deg_s": yaw_rate,
+    }
+
+
 def data_smooth_gps_savitzky(df, config):
     """
     Smooth the GPS latitude and longitude data using a Savitzky-Golay filter.
@@ -318,8 +767,11 @@ def data_smooth_gps_savitzky(df, config):
     window_length = 51  # must be odd
     polyorder = 2
 
-    df[f"{lat_col}_smooth_savitzky"] = savgol_filter(df[lat_col], window_length, polyorder)
-    df[f"{lon_col}_smooth_savitzky"] = savgol_filter(df[lon_col], window_length, polyorder)
+    # Filter both channels in one 2-D call so scipy shares the coefficient
+    # table and makes a single pass instead of two
+    smoothed = savgol_filter(df[[lat_col, lon_col]].to_numpy(), window_length, polyorder, axis=0)
+    df[f"{lat_col}_smooth_savitzky"] = smoothed[:, 0]
+    df[f"{lon_col}_smooth_savitzky"] = smoothed[:, 1]
 
     return df
 
@@ -350,7 +802,9 @@ def data_smooth_gps_gaussian(df, config):
     # Gaussian filter parameter (standard deviation)
     sigma = 2
 
-    df[f"{lat_col}_smooth_gaussian"] = gaussian_filter1d(df[lat_col], sigma)
-    df[f"{lon_col}_smooth_gaussian"] = gaussian_filter1d(df[lon_col], sigma)
+    # Same pattern as the Savitzky smoothing: both channels in one axis=0 call
+    smoothed = gaussian_filter1d(df[[lat_col, lon_col]].to_numpy(), sigma, axis=0)
+    df[f"{lat_col}_smooth_gaussian"] = smoothed[:, 0]
+    df[f"{lon_col}_smooth_gaussian"] = smoothed[:, 1]
 
     return df
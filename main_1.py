@@ -31,8 +31,9 @@ import tkinter as tk
 from tkinter import Listbox, MULTIPLE
 from csv_tools import csv_load, csv_save, csv_group_by_date_and_save, csv_get_statistics
 from data_tools import (
-    data_convert_to_planar,
+    data_convert_to_planar_batch,
     data_calculate_distance_iterative,
+    data_warmup,
     compute_heading_and_yaw_rate,
     parse_time_and_compute_dt
 )
@@ -106,11 +107,14 @@ def select_steps_and_subsets_with_gui(default_config: Dict[str, bool], subset_fo
     # Recursively get CSV files in subfolders
     subset_files = get_files_in_subfolders(subset_folder, ".csv")
 
-    # Insert files and pre-select the preferred subset if available
-    for index, subset in enumerate(subset_files):
-        subset_listbox.insert(tk.END, subset)
-        # Match the pre-selected date (ensure exact match)
-        if pre_selected_date and subset.strip() == pre_selected_date.strip():
+    # Insert all files in one C-side call instead of one Tk round-trip per
+    # item; large subset folders no longer stall the GUI start-up
+    if subset_files:
+        subset_listbox.insert(tk.END, *subset_files)
+    if pre_selected_date:
+        name_to_idx = {name.strip(): i for i, name in enumerate(subset_files)}
+        index = name_to_idx.get(pre_selected_date.strip())
+        if index is not None:
             subset_listbox.selection_set(index)
 
     subset_listbox.pack(padx=20, pady=10)
@@ -140,29 +144,42 @@ def main(config: Dict[str, Any], subsets: list[str]) -> None:
     # If enabled, group by date and save before processing subsets
     if config.get("create_subsets_by_date", True):
         print("Grouping CSV data by date and saving subsets...")
-        df = csv_load(config["input_file"])
-        if df.empty:
-            print("The input CSV file is empty. Exiting.")
-            return
-        csv_group_by_date_and_save(df, config["output_folder_for_subsets_by_date"], column_name=config["date_column"])
+        # Pass the path so csv_group_by_date_and_save streams the file in
+        # chunks; peak memory stays O(chunk size) instead of O(file size)
+        csv_group_by_date_and_save(config["input_file"], config["output_folder_for_subsets_by_date"], column_name=config["date_column"])
         print("Grouping by date completed.")
 
     root = tk.Tk()
     root.withdraw()  # Hide the root Tkinter window (optional)
 
 
-    # Process each subset file
+    # Compile the Numba kernels and build the Transformer before the loop so
+    # no subset pays the one-off JIT/setup latency
+    data_warmup()
+
+    # Load all subset files up front so the planar conversion can be batched
+    loaded_subsets = []
     for subset_file in subsets:
         subset_full_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
-        print(f"Processing subset: {subset_full_path}")
+        print(f"Loading subset: {subset_full_path}")
         df = csv_load(subset_full_path)
         if df.empty:
             print(f"The subset '{subset_file}' is empty. Skipping.")
             continue
+        loaded_subsets.append((subset_file, df))
 
-        # Step 3: Convert to planar coordinates
-        if config.get("convert_to_planar", True):
-            df = data_convert_to_planar(df, config["lat_col"], config["lon_col"])
+    # Step 3: Convert to planar coordinates for all subsets in one pyproj call;
+    # one large batch amortizes the per-call PROJ overhead that many small
+    # per-file transforms would pay again and again
+    if config.get("convert_to_planar", True):
+        data_convert_to_planar_batch(
+            [df for _, df in loaded_subsets], config["lat_col"], config["lon_col"]
+        )
+
+    # Process each subset file
+    for subset_file, df in loaded_subsets:
+        subset_full_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
+        print(f"Processing subset: {subset_full_path}")
 
         # Step 4: Calculate distances
         if config.get("calculate_distances", True):
@@ -29,15 +29,17 @@ from typing import Dict, Any
 import os
 import tkinter as tk
 from tkinter import Listbox, MULTIPLE
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
 from csv_tools import csv_load, csv_save, csv_group_by_date_and_save, csv_get_statistics, csv_get_files_in_subfolders
 from data_tools import (
     data_convert_to_planar,
     compute_heading_and_yaw_rate,
-    parse_time_and_compute_dt, data_filter_points_by_distance
+    parse_time_and_compute_dt, data_filter_points_by_distance,
+    process_gps_pipeline
 )
 
-from map_generator import generate_map_from_csv
-
 def select_steps_and_subsets_with_gui(default_config: Dict[str, bool], subset_folder: str, pre_selected_date: str = None) -> (Dict[str, bool], list[str]):
     """
     Show a GUI window for selecting which steps to run and which subsets to process.
@@ -119,9 +121,14 @@ def select_steps_and_subsets_with_gui(default_config: Dict[str, bool], subset_fo
 
     # Lade die Dateien
     subset_files = csv_get_files_in_subfolders(subset_folder, ".csv")
-    for index, subset in enumerate(subset_files):
-        subset_listbox.insert(tk.END, subset)
-        if pre_selected_date and subset.strip() == pre_selected_date.strip():
+    # Insert all files in one C-side call instead of one Tk round-trip per
+    # item; large subset folders no longer stall the GUI start-up
+    if subset_files:
+        subset_listbox.insert(tk.END, *subset_files)
+    if pre_selected_date:
+        name_to_idx = {name.strip(): i for i, name in enumerate(subset_files)}
+        index = name_to_idx.get(pre_selected_date.strip())
+        if index is not None:
             subset_listbox.selection_set(index)
 
     # Submit Button
@@ -134,40 +141,111 @@ def select_steps_and_subsets_with_gui(default_config: Dict[str, bool], subset_fo
 
 
 
-def main(config: Dict[str, Any], subsets: list[str]) -> None:
+def _toggled_suffixes(config: Dict[str, Any]) -> list[str]:
     """
-    Main entry point for the data processing workflow.
-
-    :param config: Dictionary containing configuration options, e.g.:
-        - "input_file": path to the CSV file
-        - "output_folder_for_subsets_by_date": folder for creating subsets
-        - Flags for toggling steps
-    :param subsets: List of subset files to process.
-    :return: None
+    Suffixes for the enabled steps. Depends only on the config, so main()
+    computes this once per run and caches it under "toggled_suffixes"
+    instead of rebuilding the list for every subset.
     """
+    cached = config.get("toggled_suffixes")
+    if cached is not None:
+        return cached
+    return [
+        suffix
+        for key, suffix in (
+            ("convert_to_planar", "planar"),
+            ("calculate_distances", "dist"),
+            ("parse_time", "time"),
+            ("compute_heading_yaw", "yaw"),
+        )
+        if config.get(key)
+    ]
+
+
+def _processed_output_path(subset_file: str, config: Dict[str, Any]) -> str:
+    """
+    Build the output path a processed subset will be saved to, based on the
+    steps enabled in the config. Deterministic, so it can be computed before
+    any processing to decide whether the cached result is still up to date.
+    """
+    full_subset_file_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
+    input_folder = os.path.dirname(full_subset_file_path)
 
+    processed_filename = f"{os.path.basename(subset_file).split('.')[0]}.csv"
+    toggled_suffixes = _toggled_suffixes(config)
 
+    if toggled_suffixes:
+        processed_filename = f"{processed_filename.split('.')[0]}_{'_'.join(toggled_suffixes)}.csv"
 
-    # If enabled, group by date and save before processing subsets
-    if config.get("create_subsets_by_date", True):
-        print("Grouping CSV data by date and saving subsets...")
-        df = csv_load(config["input_file"])
-        if df.empty:
-            print("The input CSV file is empty. Exiting.")
-            return
-        csv_group_by_date_and_save(df, config["output_folder_for_subsets_by_date"], column_name=config["date_column"])
-        print("Grouping by date completed.")
+    return os.path.join(input_folder, processed_filename)
 
 
-    # Process each subset file
-    for subset_file in subsets:
-        subset_full_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
-        print(f"Processing subset: {subset_full_path}")
-        df = csv_load(subset_full_path)
-        if df.empty:
-            print(f"The subset '{subset_file}' is empty. Skipping.")
-            continue
+def process_subset(subset_file: str, config: Dict[str, Any]) -> None:
+    """
+    Run the full processing chain for a single subset file.
+
+    Kept as a top-level function so it can be pickled and dispatched to
+    multiprocessing workers; each subset is fully independent.
 
+    :param subset_file: Subset file name relative to the subset folder.
+    :param config: Dictionary containing configuration options.
+    :return: None
+    """
+    subset_full_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
+
+    # Skip the whole chain when the processed file is already newer than its
+    # source; re-running unchanged subsets wastes minutes per invocation
+    if config.get("save_to_csv", True):
+        cached_output = _processed_output_path(subset_file, config)
+        if (
+            os.path.exists(cached_output)
+            and os.path.getmtime(cached_output) >= os.path.getmtime(subset_full_path)
+        ):
+            print(f"Processed file is up to date, skipping: {cached_output}")
+            return
+
+    print(f"Processing subset: {subset_full_path}")
+    # Only the date and GPS columns are touched downstream, so push the
+    # column selection into the parser instead of reading the whole file
+    # Coordinates stay float64: float32 degrees quantize to ~0.4 m at these
+    # latitudes, which is fatal for the heading/yaw math downstream
+    df = csv_load(
+        subset_full_path,
+        usecols=[config["date_column"], config["lat_col"], config["lon_col"]],
+    )
+    if df.empty:
+        print(f"The subset '{subset_file}' is empty. Skipping.")
+        return
+
+    # Steps 3-6: when every stage is enabled (the normal case), one fused
+    # NumPy pass over the raw arrays replaces the four separate DataFrame
+    # walks; otherwise fall back to the individual steps
+    run_fused = (
+        config.get("convert_to_planar", True)
+        and config.get("calculate_distances", True)
+        and config.get("parse_time", True)
+        and config.get("compute_heading_yaw", True)
+    )
+    if run_fused:
+        ts = pd.to_datetime(df[config["date_column"]]).to_numpy()
+        results = process_gps_pipeline(
+            df[config["lat_col"]].to_numpy(dtype=np.float64),
+            df[config["lon_col"]].to_numpy(dtype=np.float64),
+            ts,
+            config["min_distance"],
+        )
+        df = df.loc[results["keep"]].reset_index(drop=True)
+        # A too-large min_distance can filter everything away; do not run
+        # save/statistics/map on an empty frame
+        if df.empty:
+            print(f"No rows left after distance filtering for '{subset_file}'. Skipping.")
+            return
+        df[config["x_col"]] = results["x"]
+        df[config["y_col"]] = results["y"]
+        df[config["time_between_points"]] = results["dt"]
+        df["heading_deg"] = results["heading_deg"]
+        df[config["yaw_rate_cyril"]] = results["yaw_rate_deg_s"]
+    else:
         # Step 3: Convert to planar coordinates
         if config.get("convert_to_planar", True):
             df = data_convert_to_planar(df, config["lat_col"], config["lon_col"])
@@ -177,6 +255,9 @@ def main(config: Dict[str, Any], subsets: list[str]) -> None:
             df = data_filter_points_by_distance(
                 df, x_col=config["x_col"], y_col=config["y_col"], min_distance=config["min_distance"]
             )
+            if df.empty:
+                print(f"No rows left after distance filtering for '{subset_file}'. Skipping.")
+                return
 
         # Step 5: Parse time and compute time differences
         if config.get("parse_time", True):
@@ -189,50 +270,84 @@ def main(config: Dict[str, Any], subsets: list[str]) -> None:
             )
 
 
-        # Step 8: Save processed data
-        if config.get("save_to_csv", True):
-            # Resolve the full path of the input file
-            full_subset_file_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
-
-            # Extract the folder where the input file resides
-            input_folder = os.path.dirname(full_subset_file_path)
-
-            # Construct the base output file path
-            processed_filename = f"{os.path.basename(subset_file).split('.')[0]}.csv"
-            toggled_suffixes = []
-            if config.get("convert_to_planar"):
-                toggled_suffixes.append("planar")
-            if config.get("calculate_distances"):
-                toggled_suffixes.append("dist")
-            if config.get("parse_time"):
-                toggled_suffixes.append("time")
-            if config.get("compute_heading_yaw"):
-                toggled_suffixes.append("yaw")
-
-            # Add the suffixes to the filename
-            if toggled_suffixes:
-                processed_filename = f"{processed_filename.split('.')[0]}_{'_'.join(toggled_suffixes)}.csv"
-
-            date_specific_output = os.path.join(input_folder, processed_filename)
-
-            # Save the processed file and optionally calculate statistics
-            csv_save(
-                df,
-                date_specific_output,
-                ensure_folder=False,
-                suffixes=toggled_suffixes,
-                run_stats=config.get("enable_statistics_on_save", False)
-            )
-            print(f"Saved processed data to {date_specific_output}")
+    # Step 8: Save processed data
+    if config.get("save_to_csv", True):
+        # The suffixes are already baked into the output path
+        date_specific_output = _processed_output_path(subset_file, config)
+
+        # Save the processed file and optionally calculate statistics
+        csv_save(
+            df,
+            date_specific_output,
+            ensure_folder=False,
+            run_stats=config.get("enable_statistics_on_save", False)
+        )
+        print(f"Saved processed data to {date_specific_output}")
+
+    # Step 9: Statistics — reuse the in-memory frame instead of re-reading
+    # the subset file from disk. The frame is column-restricted and
+    # distance-filtered by now, so the report is named after the processed
+    # output it describes, not after the raw subset file
+    if config.get("statistics", True):
+        stats_path = _processed_output_path(subset_file, config)
+        print(f"Saving statistics for {stats_path}...")
+        csv_get_statistics(df, file_path=stats_path)
+
+    # Step 10: Generate the Map
+    if config.get("generate_map", True):
+        # Imported lazily: folium/branca cost seconds and tens of MB at
+        # import time and are dead weight when maps are disabled
+        from map_generator import generate_map_from_csv
+        generate_map_from_csv(subset_full_path)
+
+
+def _process_subset_chunk(chunk: list[str], config: Dict[str, Any]) -> None:
+    """Process a sub-list of subset files sequentially inside one worker."""
+    for subset_file in chunk:
+        process_subset(subset_file, config)
+
+
+def main(config: Dict[str, Any], subsets: list[str]) -> None:
+    """
+    Main entry point for the data processing workflow.
 
-        # Step 9: Statistics
-        if config.get("statistics", True):
-            print(f"Saving statistics for {subset_full_path}...")
-            csv_get_statistics(subset_full_path)
+    :param config: Dictionary containing configuration options, e.g.:
+        - "input_file": path to the CSV file
+        - "output_folder_for_subsets_by_date": folder for creating subsets
+        - Flags for toggling steps
+    :param subsets: List of subset files to process.
+    :return: None
+    """
+
+
+
+    # If enabled, group by date and save before processing subsets.
+    # This step stays serial: the workers below read the files it writes.
+    if config.get("create_subsets_by_date", True):
+        print("Grouping CSV data by date and saving subsets...")
+        # Pass the path so csv_group_by_date_and_save streams the file in
+        # chunks; peak memory stays O(chunk size) instead of O(file size)
+        csv_group_by_date_and_save(config["input_file"], config["output_folder_for_subsets_by_date"], column_name=config["date_column"])
+        print("Grouping by date completed.")
 
-        # Step 10: Generate the Map
-        if config.get("generate_map", True):
-            generate_map_from_csv(subset_full_path)
+    # The suffix list depends only on the config, so build it once here
+    # instead of once per subset inside the workers
+    config["toggled_suffixes"] = _toggled_suffixes(config)
+
+    # Process the subset files in parallel. Each worker gets a whole
+    # sub-list instead of one task per file, so the config is pickled once
+    # per worker rather than once per subset — the dispatch overhead stays
+    # constant no matter how many small files there are.
+    # A single subset is not worth the worker start-up cost.
+    if len(subsets) > 1:
+        n_jobs = min(os.cpu_count(), len(subsets))
+        chunks = [subsets[i::n_jobs] for i in range(n_jobs)]
+        Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_process_subset_chunk)(chunk, config) for chunk in chunks
+        )
+    else:
+        for subset_file in subsets:
+            process_subset(subset_file, config)
 
 
 
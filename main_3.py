@@ -29,6 +29,7 @@ from typing import Dict, Any
 import os
 import tkinter as tk
 from tkinter import Listbox, MULTIPLE
+from joblib import Parallel, delayed
 from csv_tools import csv_load, csv_save, csv_group_by_date_and_save, csv_get_statistics, csv_get_files_in_subfolders
 from data_tools import (
     data_convert_to_planar,
@@ -36,8 +37,6 @@ from data_tools import (
     parse_time_and_compute_dt, data_filter_points_by_distance, data_compute_heading_and_yaw_rate_spline,
    )
 
-from map_generator import generate_map_from_csv
-
 def select_steps_and_subsets_with_gui(default_config: Dict[str, bool], subset_folder: str, pre_selected_date: str = None) -> (Dict[str, bool], list[str], float):
     """
     Show a GUI window for selecting which steps to run and which subsets to process.
@@ -122,9 +121,14 @@ def select_steps_and_subsets_with_gui(default_config: Dict[str, bool], subset_fo
 
     # Load files
     subset_files = csv_get_files_in_subfolders(subset_folder, ".csv")
-    for index, subset in enumerate(subset_files):
-        subset_listbox.insert(tk.END, subset)
-        if pre_selected_date and subset.strip() == pre_selected_date.strip():
+    # Insert all files in one C-side call instead of one Tk round-trip per
+    # item; large subset folders no longer stall the GUI start-up
+    if subset_files:
+        subset_listbox.insert(tk.END, *subset_files)
+    if pre_selected_date:
+        name_to_idx = {name.strip(): i for i, name in enumerate(subset_files)}
+        index = name_to_idx.get(pre_selected_date.strip())
+        if index is not None:
             subset_listbox.selection_set(index)
 
     # Add input for min_distance
@@ -144,6 +148,156 @@ def select_steps_and_subsets_with_gui(default_config: Dict[str, bool], subset_fo
 
 
 
+def _processed_output_path(subset_file: str, config: Dict[str, Any]) -> str:
+    """
+    Build the output path a processed subset will be saved to, based on the
+    steps enabled in the config. Deterministic, so it can be computed before
+    any processing to decide whether the cached result is still up to date.
+    """
+    suffixes = set()
+    if config.get("convert_to_planar", True):
+        suffixes.add("planar")
+    if config.get("filter_with_distances", True):
+        suffixes.add("dist")
+    if config.get("parse_time", True):
+        suffixes.add("time")
+    if config.get("compute_heading_yaw", True):
+        suffixes.add("yaw")
+    if config.get("compute_heading_and_yaw_rate_with_spline", True):
+        suffixes.add("spline")
+
+    suffix_string = "_".join(sorted(suffixes))
+    base_filename = os.path.splitext(subset_file)[0]
+    # Feather instead of CSV: the processed frame is an intermediate that
+    # only this pipeline reads back, and the columnar binary round-trip
+    # skips the float<->text conversions entirely
+    processed_filename = f"{base_filename}_{suffix_string}.feather"
+    return os.path.join(config["output_folder_for_subsets_by_date"], processed_filename)
+
+
+def process_subset(subset_file: str, config: Dict[str, Any]) -> None:
+    """
+    Run the full processing chain for a single subset file.
+
+    Kept as a top-level function so it can be pickled and dispatched to
+    multiprocessing workers; each subset is fully independent.
+
+    :param subset_file: Subset file name relative to the subset folder.
+    :param config: Dictionary containing configuration options.
+    :return: None
+    """
+    subset_full_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
+
+    # Skip the whole chain when the processed file is already newer than its
+    # source; re-running unchanged subsets wastes minutes per invocation
+    if config.get("save_to_csv", True):
+        cached_output = _processed_output_path(subset_file, config)
+        if (
+            os.path.exists(cached_output)
+            and os.path.getmtime(cached_output) >= os.path.getmtime(subset_full_path)
+        ):
+            print(f"Processed file is up to date, skipping: {cached_output}")
+            return
+
+    print(f"Processing subset: {subset_full_path}")
+    # Only the date and GPS columns are touched downstream, so push the
+    # column selection into the parser instead of reading the whole file
+    # Coordinates stay float64: float32 degrees quantize to ~0.4 m at these
+    # latitudes, which is fatal for the heading/yaw math downstream
+    df = csv_load(
+        subset_full_path,
+        usecols=[config["date_column"], config["lat_col"], config["lon_col"]],
+    )
+    processed_suffixes = set()
+    print(f"The suffixe is '{processed_suffixes}' .")
+    if df.empty:
+        print(f"The subset '{subset_file}' is empty. Skipping.")
+        return
+
+    # Convert to planar coordinates
+    if config.get("convert_to_planar", True):
+        df = data_convert_to_planar(df, config["lat_col"], config["lon_col"])
+        processed_suffixes.add("planar")
+        print(f"The suffixe is '{processed_suffixes}' .")
+
+
+    # Calculate distances
+    if config.get("filter_with_distances", True):
+        df = data_filter_points_by_distance(
+            df, x_col=config["x_col"], y_col=config["y_col"], min_distance=config["min_distance"]
+        )
+        processed_suffixes.add("dist")
+        print(f"The suffixe is '{processed_suffixes}' .")
+        # A too-large min_distance can filter everything away; do not run
+        # the remaining steps, save, statistics or map on an empty frame
+        if df.empty:
+            print(f"No rows left after distance filtering for '{subset_file}'. Skipping.")
+            return
+
+    # Parse time and compute time differences
+    if config.get("parse_time", True):
+        df = parse_time_and_compute_dt(df, config["date_column"])
+        processed_suffixes.add("time")
+        print(f"The suffixe is '{processed_suffixes}' .")
+
+    # Compute heading and yaw rate
+    if config.get("compute_heading_yaw", True):
+        df = compute_heading_and_yaw_rate(
+            df, config["x_col"], config["y_col"], dt=config["time_between_points"]
+        )
+        processed_suffixes.add("yaw")
+        print(f"The suffixe is '{processed_suffixes}' .")
+
+    # Compute Heading and Yaw rate with spline
+    if config.get("compute_heading_and_yaw_rate_with_spline", True):
+        df = data_compute_heading_and_yaw_rate(
+            df=df,
+            x_col=config["x_col"],
+            y_col=config["y_col"],
+            dt=config["time_between_points"]
+        )
+        processed_suffixes.add("spline")
+
+
+    # Save processed data
+    if config.get("save_to_csv", True):
+
+        # Generate the final filename with unique suffixes
+        print(f"The suffixe is '{processed_suffixes}' .")
+        # The suffixes are already baked into the output path
+        save_path = _processed_output_path(subset_file, config)
+        csv_save(
+            df,
+            save_path,
+            ensure_folder=False,
+            run_stats=config.get("enable_statistics_on_save", True)
+        )
+        print(f"Saved processed data to {save_path}")
+
+
+    # Statistics — reuse the in-memory frame instead of re-reading the
+    # subset file from disk. The frame is column-restricted and
+    # distance-filtered by now, so the report is named after the processed
+    # output it describes, not after the raw subset file
+    if config.get("statistics", True):
+        stats_path = _processed_output_path(subset_file, config)
+        print(f"Saving statistics for {stats_path}...")
+        csv_get_statistics(df, file_path=stats_path)
+
+    # Generate the Map
+    if config.get("generate_map", True):
+        # Imported lazily: folium/branca cost seconds and tens of MB at
+        # import time and are dead weight when maps are disabled
+        from map_generator import generate_map_from_csv
+        generate_map_from_csv(subset_full_path)
+
+
+def _process_subset_chunk(chunk: list[str], config: Dict[str, Any]) -> None:
+    """Process a sub-list of subset files sequentially inside one worker."""
+    for subset_file in chunk:
+        process_subset(subset_file, config)
+
+
 def main(config: Dict[str, Any], subsets: list[str]) -> None:
     """
     Main entry point for the data processing workflow.
@@ -158,97 +312,30 @@ def main(config: Dict[str, Any], subsets: list[str]) -> None:
 
 
 
-    # If enabled, group by date and save before processing subsets
+    # If enabled, group by date and save before processing subsets.
+    # This step stays serial: the workers below read the files it writes.
     if config.get("create_subsets_by_date", True):
         print("Grouping CSV data by date and saving subsets...")
-        df = csv_load(config["input_file"])
-        if df.empty:
-            print("The input CSV file is empty. Exiting.")
-            return
-        csv_group_by_date_and_save(df, config["output_folder_for_subsets_by_date"], column_name=config["date_column"])
+        # Pass the path so csv_group_by_date_and_save streams the file in
+        # chunks; peak memory stays O(chunk size) instead of O(file size)
+        csv_group_by_date_and_save(config["input_file"], config["output_folder_for_subsets_by_date"], column_name=config["date_column"])
         print("Grouping by date completed.")
 
 
-    # Process each subset file
-    for subset_file in subsets:
-        subset_full_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
-        print(f"Processing subset: {subset_full_path}")
-        df = csv_load(subset_full_path)
-        processed_suffixes = set()
-        print(f"The suffixe is '{processed_suffixes}' .")
-        if df.empty:
-            print(f"The subset '{subset_file}' is empty. Skipping.")
-            continue
-
-        # Convert to planar coordinates
-        if config.get("convert_to_planar", True):
-            df = data_convert_to_planar(df, config["lat_col"], config["lon_col"])
-            processed_suffixes.add("planar")
-            print(f"The suffixe is '{processed_suffixes}' .")
-
-
-        # Calculate distances
-        if config.get("filter_with_distances", True):
-            df = data_filter_points_by_distance(
-                df, x_col=config["x_col"], y_col=config["y_col"], min_distance=config["min_distance"]
-            )
-            processed_suffixes.add("dist")
-            print(f"The suffixe is '{processed_suffixes}' .")
-
-        # Parse time and compute time differences
-        if config.get("parse_time", True):
-            df = parse_time_and_compute_dt(df, config["date_column"])
-            processed_suffixes.add("time")
-            print(f"The suffixe is '{processed_suffixes}' .")
-
-        # Compute heading and yaw rate
-        if config.get("compute_heading_yaw", True):
-            df = compute_heading_and_yaw_rate(
-                df, config["x_col"], config["y_col"], dt=config["time_between_points"]
-            )
-            processed_suffixes.add("yaw")
-            print(f"The suffixe is '{processed_suffixes}' .")
-
-        # Compute Heading and Yaw rate with spline
-        if config.get("compute_heading_and_yaw_rate_with spline", True):
-            df = data_compute_heading_and_yaw_rate(
-                df=df,
-                x_col=config["x_col"],
-                y_col=config["y_col"],
-                dt=config["time_between_points"]
-            )
-            processed_suffixes.add("spline")
-
-
-        # Save processed data
-        if config.get("save_to_csv", True):
-
-            # Generate the final filename with unique suffixes
-            print(f"The suffixe is '{processed_suffixes}' .")
-            suffix_string = "_".join(sorted(processed_suffixes))  # Sort for consistency
-            base_filename = os.path.splitext(subset_file)[0]  # Extract base name
-            processed_filename = f"{base_filename}_{suffix_string}.csv"  # Build the filename
-
-            # Save the processed file
-            save_path = os.path.join(config["output_folder_for_subsets_by_date"], processed_filename)
-            csv_save(
-                df,
-                save_path,
-                ensure_folder=False,
-                suffixes=list(processed_suffixes),
-                run_stats=config.get("enable_statistics_on_save", True)
-            )
-            print(f"Saved processed data to {save_path}")
-
-
-        # Statistics
-        if config.get("statistics", True):
-            print(f"Saving statistics for {subset_full_path}...")
-            csv_get_statistics(subset_full_path)
-
-        # Generate the Map
-        if config.get("generate_map", True):
-            generate_map_from_csv(subset_full_path)
+    # Process the subset files in parallel. Each worker gets a whole
+    # sub-list instead of one task per file, so the config is pickled once
+    # per worker rather than once per subset — the dispatch overhead stays
+    # constant no matter how many small files there are.
+    # A single subset is not worth the worker start-up cost.
+    if len(subsets) > 1:
+        n_jobs = min(os.cpu_count(), len(subsets))
+        chunks = [subsets[i::n_jobs] for i in range(n_jobs)]
+        Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_process_subset_chunk)(chunk, config) for chunk in chunks
+        )
+    else:
+        for subset_file in subsets:
+            process_subset(subset_file, config)
 
 
 
@@ -263,7 +350,7 @@ if __name__ == "__main__":
         "compute_heading_yaw": True,
         "generate_map" : False,
         "statistics": False,
-        "compute_heading_and_yaw_rate_with spline" : True,
+        "compute_heading_and_yaw_rate_with_spline" : True,
         "save_to_csv": True,
         "enable_statistics_on_save": True,  # Toggle this to enable/disable statistics on save
     }
@@ -272,6 +359,12 @@ if __name__ == "__main__":
     selected_steps, selected_subsets, min_distance = select_steps_and_subsets_with_gui(default_config, subset_folder,
                                                                                        pre_selected_date)
 
+    # A mistyped toggle key would silently fall back to the config.get
+    # default inside the pipeline, so fail fast on anything unknown
+    unknown_steps = set(selected_steps) - set(default_config)
+    if unknown_steps:
+        raise KeyError(f"Unknown step toggles: {sorted(unknown_steps)}")
+
     config = {
         "input_file": None,  # Allow dynamic file selection
         "output_folder_for_subsets_by_date": subset_folder,
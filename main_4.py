@@ -36,6 +36,7 @@ Author:
   Cyril Piette / TU_Berlin / 2025
 """
 
+import concurrent.futures
 import os
 import tkinter as tk
 from tkinter import Listbox, MULTIPLE
@@ -214,6 +215,14 @@ def main(config: Dict[str, Any], subsets: List[str]) -> None:
         print("Grouping by date completed.")
 
     # 2. Process each subset file
+    # Map rendering is by far the heaviest per-subset step and is CPU-bound
+    # on folium string-building, so it runs in background processes: subset
+    # k+1's numerical work overlaps with map k's render
+    map_executor = None
+    map_futures = []
+    if config.get("generate_map", False):
+        map_executor = concurrent.futures.ProcessPoolExecutor(max_workers=2)
+
     for subset_file in subsets:
         # subset_file is a *relative path* from the chosen folder
         subset_full_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
@@ -284,11 +293,18 @@ def main(config: Dict[str, Any], subsets: List[str]) -> None:
         # Generate the map based on the toggles
         if config.get("generate_map", False):  # Check if map generation is enabled in the configuration
             if config.get("save_to_csv", True):  # If save_to_csv is enabled, use the processed CSV file for the map
-                print(f"Generating map using the processed file: {save_path}")
-                generate_map_from_csv(save_path)
+                print(f"Scheduling map generation for the processed file: {save_path}")
+                map_futures.append(map_executor.submit(generate_map_from_csv, save_path))
             else:  # If save_to_csv is disabled, use the original subset file for the map
-                print(f"Generating map using the original subset file: {subset_full_path}")
-                generate_map_from_csv(subset_full_path)
+                print(f"Scheduling map generation for the original subset file: {subset_full_path}")
+                map_futures.append(map_executor.submit(generate_map_from_csv, subset_full_path))
+
+    # Drain the background map renders before returning so failures surface
+    if map_executor is not None:
+        concurrent.futures.wait(map_futures)
+        for future in map_futures:
+            future.result()
+        map_executor.shutdown()
 
 
 if __name__ == "__main__":
@@ -37,10 +37,12 @@ Author:
 """
 
 import os
-import tkinter as tk
-from tkinter import Listbox, MULTIPLE
+import sys
+from multiprocessing import Pool, cpu_count
 from typing import Dict, Any, List, Tuple
 
+import pandas as pd
+
 # Local module imports
 from csv_tools import (
     csv_load,
@@ -51,13 +53,14 @@ from csv_tools import (
 )
 from data_tools import (
     data_convert_to_planar,
+    data_pick_smoothing_columns,
     data_compute_heading_from_xy,
+    data_warmup,
     parse_time_and_compute_dt,
     data_filter_points_by_distance,
     data_compute_yaw_rate_from_heading,
     data_smooth_gps_savitzky, data_smooth_gps_gaussian,
 )
-from map_generator import generate_map_from_csv
 
 
 def select_steps_and_subsets_with_gui(
@@ -85,6 +88,10 @@ def select_steps_and_subsets_with_gui(
         - List of subset file paths selected in the GUI (relative to subset_folder).
         - The min_distance value (float).
     """
+    # Imported here rather than at module level: headless runs (see the
+    # --config path in __main__) never pay the Tk import cost
+    import tkinter as tk
+    from tkinter import Listbox, MULTIPLE
 
     root = tk.Tk()
     root.title("Data Processing Options")
@@ -125,16 +132,19 @@ def select_steps_and_subsets_with_gui(
 
     # We will store the original relative paths here
     # but display only the base name in the listbox for clarity
-    file_paths = []  # keeps the relative paths
-    for index, relative_path in enumerate(subset_files):
-        # Extract just the filename from the relative path
-        file_name = os.path.basename(relative_path)
-
-        file_paths.append(relative_path)  # keep the original relative path
-        subset_listbox.insert(tk.END, file_name)
-
-        # Pre-select if it matches the base filename
-        if pre_selected_date and file_name.strip() == pre_selected_date.strip():
+    file_paths = list(subset_files)  # keeps the relative paths
+    file_names = [os.path.basename(p) for p in file_paths]
+
+    # Insert all names in one C-side call instead of one Tk round-trip per
+    # item; large subset folders no longer stall the GUI start-up
+    if file_names:
+        subset_listbox.insert(tk.END, *file_names)
+
+    # Pre-select if it matches the base filename
+    if pre_selected_date:
+        name_to_idx = {name.strip(): i for i, name in enumerate(file_names)}
+        index = name_to_idx.get(pre_selected_date.strip())
+        if index is not None:
             subset_listbox.selection_set(index)
 
     # --- Minimum Distance Input ---
@@ -181,6 +191,122 @@ def select_steps_and_subsets_with_gui(
     return selected_steps, selected_subsets, min_distance
 
 
+def process_subset(subset_file: str, config: Dict[str, Any], smoothing_choice=None) -> None:
+    """
+    Run the full processing chain for one subset file.
+
+    Kept at module level so multiprocessing can pickle it; the
+    smoothing-column choice is resolved once in the parent (it comes
+    from a Tk dialog, which must not be opened inside worker processes)
+    and passed in ready-made.
+    """
+    # subset_file is a *relative path* from the chosen folder
+    subset_full_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
+    print(f"\nProcessing subset: {subset_full_path}")
+
+    df_subset = csv_load(subset_full_path)
+    processed_suffixes = []
+
+    if df_subset.empty:
+        print(f"Subset '{subset_file}' is empty. Skipping.")
+        return
+
+    # Smoothing the GPS coordinates with Savitzky
+    if config.get("smooth_gps_data_with_savitzky", True):
+        df_subset = data_smooth_gps_savitzky(df_subset, config)
+        processed_suffixes.append("savitzky")
+
+    # Smoothing the GPS coordinates with Gaussian
+    if config.get("smooth_gps_data_with_gaussian", True):
+        df_subset = data_smooth_gps_gaussian(df_subset, config)
+        processed_suffixes.append("gaussian")
+
+    # Convert to planar coordinates
+    if config.get("convert_to_planar", True):
+        if smoothing_choice is None:
+            smoothing_choice = data_pick_smoothing_columns(df_subset, config)
+
+        # The projection is deterministic given the smoothing choice, so
+        # cache x/y in a sidecar file and skip pyproj entirely on re-runs
+        # (typical when iterating on min_distance from the GUI)
+        xy_cache = f"{os.path.splitext(subset_full_path)[0]}_xy_{smoothing_choice[2]}.feather"
+        cached = None
+        if (
+            os.path.exists(xy_cache)
+            and os.path.getmtime(xy_cache) >= os.path.getmtime(subset_full_path)
+        ):
+            cached = pd.read_feather(xy_cache)
+            if len(cached) != len(df_subset):
+                cached = None  # source changed since the cache was written
+
+        if cached is not None:
+            df_subset["x"] = cached["x"].to_numpy()
+            df_subset["y"] = cached["y"].to_numpy()
+            df_subset["selected_smoothing_method"] = smoothing_choice[2]
+        else:
+            df_subset = data_convert_to_planar(df_subset, config, columns=smoothing_choice)
+            df_subset[["x", "y"]].reset_index(drop=True).to_feather(xy_cache)
+        processed_suffixes.append("planar")
+
+    # Filter points based on minimum distance
+    if config.get("filter_with_distances", True):
+        df_subset = data_filter_points_by_distance(df_subset, config)
+        processed_suffixes.append("dist")
+        # A too-large min_distance can filter everything away; do not
+        # run the remaining steps, save or map on an empty frame
+        if df_subset.empty:
+            print(f"No rows left after distance filtering for '{subset_file}'. Skipping.")
+            return
+
+    # Parse time and compute dt
+    if config.get("parse_time", True):
+        df_subset = parse_time_and_compute_dt(df_subset, config["date_column"])
+        processed_suffixes.append("time")
+
+    # Compute heading from xy
+    if config.get("compute_heading_from_xy", True):
+        df_subset = data_compute_heading_from_xy(df_subset, config)
+        processed_suffixes.append("heading")
+
+    # Compute the yaw rate from the heading
+    if config.get("compute_yaw_rate_from_heading", True):
+        df_subset = data_compute_yaw_rate_from_heading(df_subset, config)
+        processed_suffixes.append("yawRate")
+
+    # Save processed data to CSV
+    save_path = None
+    if config.get("save_to_csv", True):
+        suffix_string = "_".join(processed_suffixes)
+        base_filename = os.path.splitext(subset_file)[0]
+        processed_filename = f"{base_filename}_{suffix_string}.csv"
+        save_path = os.path.join(config["output_folder_for_subsets_by_date"], processed_filename)
+
+        csv_save(
+            df_subset,
+            save_path,
+            ensure_folder=False,
+            #suffixes=list(processed_suffixes),
+            run_stats=config.get("enable_statistics_on_save", False)
+        )
+
+    # Generate statistics
+    if config.get("statistics", False):
+        print(f"Saving statistics for: {subset_full_path}")
+        csv_get_statistics(subset_full_path)
+
+    # Generate the map based on the toggles
+    if config.get("generate_map", False):  # Check if map generation is enabled in the configuration
+        # Imported lazily: folium/branca cost seconds and tens of MB at
+        # import time and are dead weight when maps are disabled
+        from map_generator import generate_map_from_csv
+        if save_path is not None:  # If save_to_csv is enabled, use the processed CSV file for the map
+            print(f"Generating map using the processed file: {save_path}")
+            generate_map_from_csv(save_path)
+        else:  # If save_to_csv is disabled, use the original subset file for the map
+            print(f"Generating map using the original subset file: {subset_full_path}")
+            generate_map_from_csv(subset_full_path)
+
+
 def main(config: Dict[str, Any], subsets: List[str]) -> None:
     """
     Main entry point for the data processing workflow.
@@ -213,91 +339,67 @@ def main(config: Dict[str, Any], subsets: List[str]) -> None:
         print("Grouping by date completed.")
 
     # 2. Process each subset file
-    for subset_file in subsets:
-        # subset_file is a *relative path* from the chosen folder
-        subset_full_path = os.path.join(config["output_folder_for_subsets_by_date"], subset_file)
-        print(f"\nProcessing subset: {subset_full_path}")
-
-        df_subset = csv_load(subset_full_path)
-        processed_suffixes = []
-
-        if df_subset.empty:
-            print(f"Subset '{subset_file}' is empty. Skipping.")
-            continue
-
-        # Smoothing the GPS coordinates with Savitzky
-        if config.get("smooth_gps_data_with_savitzky", True):
-            df_subset = data_smooth_gps_savitzky(df_subset, config)
-            processed_suffixes.append("savitzky")
-
-        # Smoothing the GPS coordinates with Gaussian
-        if config.get("smooth_gps_data_with_gaussian", True):
-            df_subset = data_smooth_gps_gaussian(df_subset, config)
-            processed_suffixes.append("gaussian")
-
-        # Convert to planar coordinates
-        if config.get("convert_to_planar", True):
-            df_subset = data_convert_to_planar(df_subset, config)
-            processed_suffixes.append("planar")
-
-        # Filter points based on minimum distance
-        if config.get("filter_with_distances", True):
-            df_subset = data_filter_points_by_distance(df_subset, config)
-            processed_suffixes.append("dist")
-
-        # Parse time and compute dt
-        if config.get("parse_time", True):
-            df_subset = parse_time_and_compute_dt(df_subset, config["date_column"])
-            processed_suffixes.append("time")
-
-        # Compute heading from xy
-        if config.get("compute_heading_from_xy", True):
-            df_subset = data_compute_heading_from_xy(
-                df_subset,
-                x_col=config["x_col"],
-                y_col=config["y_col"],
-                heading_col="heading_deg"
-            )
-            processed_suffixes.append("heading")
-
-        # Compute the yaw rate from the heading
-        if config.get("compute_yaw_rate_from_heading", True):
-            df_subset = data_compute_yaw_rate_from_heading(
-                df_subset,
-                heading_col="heading_deg",  # or whatever you call it
-                dt_col="dt",
-                yaw_rate_col="yaw_rate_deg_s"
+    if not subsets:
+        return
+
+    # The smoothing-column choice applies to every subset and comes from a
+    # Tk dialog, so resolve it once in the parent before any workers start.
+    # Headless runs set "smoothing_method" in the TOML config instead: the
+    # choice is built straight from the key so no Tk window (and no
+    # $DISPLAY) is ever needed. Otherwise the smoothing steps append fixed
+    # suffixes, so the columns that will exist after they run are known
+    # from the toggles alone; an empty frame carrying those names drives
+    # the existing picker without loading (or prematurely smoothing) any
+    # subset.
+    smoothing_choice = None
+    if config.get("convert_to_planar", True):
+        method = config.get("smoothing_method")
+        if method:
+            if method == "none":
+                smoothing_choice = (config["lat_col"], config["lon_col"], "none")
+            elif method in ("savitzky", "gaussian"):
+                smoothing_choice = (
+                    f"{config['lat_col']}_smooth_{method}",
+                    f"{config['lon_col']}_smooth_{method}",
+                    method,
+                )
+            else:
+                raise ValueError(
+                    f"Invalid smoothing_method: {method!r}. "
+                    "Expected 'savitzky', 'gaussian' or 'none'."
+                )
+        else:
+            expected_columns = [config["lat_col"], config["lon_col"]]
+            for picker_method, toggle in (
+                ("savitzky", "smooth_gps_data_with_savitzky"),
+                ("gaussian", "smooth_gps_data_with_gaussian"),
+            ):
+                if config.get(toggle, True):
+                    expected_columns += [
+                        f"{config['lat_col']}_smooth_{picker_method}",
+                        f"{config['lon_col']}_smooth_{picker_method}",
+                    ]
+            smoothing_choice = data_pick_smoothing_columns(
+                pd.DataFrame(columns=expected_columns), config
             )
-            processed_suffixes.append("yawRate")
-
-        # Save processed data to CSV
-        if config.get("save_to_csv", True):
-            suffix_string = "_".join(processed_suffixes)
-            base_filename = os.path.splitext(subset_file)[0]
-            processed_filename = f"{base_filename}_{suffix_string}.csv"
-            save_path = os.path.join(config["output_folder_for_subsets_by_date"], processed_filename)
-
-            csv_save(
-                df_subset,
-                save_path,
-                ensure_folder=False,
-                #suffixes=list(processed_suffixes),
-                run_stats=config.get("enable_statistics_on_save", False)
-            )
-
-        # Generate statistics
-        if config.get("statistics", False):
-            print(f"Saving statistics for: {subset_full_path}")
-            csv_get_statistics(subset_full_path)
 
-        # Generate the map based on the toggles
-        if config.get("generate_map", False):  # Check if map generation is enabled in the configuration
-            if config.get("save_to_csv", True):  # If save_to_csv is enabled, use the processed CSV file for the map
-                print(f"Generating map using the processed file: {save_path}")
-                generate_map_from_csv(save_path)
-            else:  # If save_to_csv is disabled, use the original subset file for the map
-                print(f"Generating map using the original subset file: {subset_full_path}")
-                generate_map_from_csv(subset_full_path)
+    # Compile the Numba kernels and build the cached Transformer once in the
+    # parent; with cache=True the workers load the compiled artifacts from
+    # disk instead of each paying the JIT latency on their first subset
+    data_warmup()
+
+    # Subsets are independent days, so fan them out across cores; a single
+    # selection stays in-process to avoid the Pool start-up cost
+    n_workers = min(cpu_count(), len(subsets))
+    if n_workers > 1:
+        with Pool(n_workers) as pool:
+            pool.starmap(
+                process_subset,
+                [(subset_file, config, smoothing_choice) for subset_file in subsets],
+            )
+    else:
+        for subset_file in subsets:
+            process_subset(subset_file, config, smoothing_choice)
 
 
 if __name__ == "__main__":
@@ -323,12 +425,32 @@ if __name__ == "__main__":
     # Optionally, specify a file in subsets_by_date to pre-select
     pre_selected_date = "2024-04-02.csv"
 
-    # Launch the compact GUI
-    selected_steps, selected_subsets, min_distance = select_steps_and_subsets_with_gui(
-        default_config,
-        SUBSET_FOLDER,
-        pre_selected_date
-    )
+    # Headless fast path: a TOML config (via --config or CONFIG_PATH) skips
+    # the Tk dialog entirely, so batch runs (cron, parameter sweeps) start
+    # in milliseconds instead of waiting on the GUI event loop
+    config_path = os.environ.get("CONFIG_PATH")
+    if "--config" in sys.argv:
+        config_path = sys.argv[sys.argv.index("--config") + 1]
+
+    if config_path:
+        import tomllib
+        with open(config_path, "rb") as fh:
+            file_config = tomllib.load(fh)
+        selected_steps = {**default_config, **file_config.get("steps", {})}
+        selected_subsets = file_config.get("subsets", [])
+        min_distance = float(file_config.get("min_distance", 1.0))
+        # Pre-selected smoothing method ("savitzky", "gaussian" or "none"):
+        # with it set, main() never opens the Tk column picker, so the run
+        # works on display-less machines (cron, CI)
+        smoothing_method = file_config.get("smoothing_method")
+    else:
+        smoothing_method = None
+        # Launch the compact GUI
+        selected_steps, selected_subsets, min_distance = select_steps_and_subsets_with_gui(
+            default_config,
+            SUBSET_FOLDER,
+            pre_selected_date
+        )
 
     # Merge selected steps into final config
     config = {
@@ -345,6 +467,7 @@ if __name__ == "__main__":
         "distance_col": "distance",
         "time_between_points": "dt",
         "min_distance": min_distance,
+        "smoothing_method": smoothing_method,
         **selected_steps
     }
 
@@ -1,12 +1,88 @@
+import glob
+import hashlib
 import os
+
+import numpy as np
 import pandas as pd
-import geopandas as gpd
-from shapely.geometry import Point
 import folium
 from folium.plugins import TimestampedGeoJson
 from matplotlib import colormaps, colors
 from branca.colormap import LinearColormap
 
+# Size of the quantized colour lookup tables; 1024 bins are visually
+# indistinguishable from the exact mapping
+_LUT_SIZE = 1024
+
+# The colormaps are fixed, so resolve them once at import instead of a
+# registry lookup per generated map
+_CMAP_TURBO = colormaps.get_cmap("turbo")
+_CMAP_COOLWARM = colormaps.get_cmap("coolwarm")
+
+
+def _batch_hex(rgba):
+    """
+    Format an (N, 4) RGBA float array as hex strings in one pass over a
+    compact uint8 array; matplotlib's to_hex only takes scalars and
+    allocates tuples and intermediates on every call.
+    """
+    rgb_u8 = (np.asarray(rgba)[:, :3] * 255 + 0.5).astype(np.uint8)
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb_u8]
+
+
+def _hex_lut(cmap, n=_LUT_SIZE):
+    """
+    Precompute hex colours for a colormap so the per-segment
+    norm -> cmap -> to_hex chain collapses to one integer index.
+    """
+    return _batch_hex(cmap(np.linspace(0.0, 1.0, n)))
+
+
+# The tables are data-independent, so build them once at import (Colormap
+# instances are not hashable on recent matplotlib, so no lru_cache here)
+_TURBO_LUT = _hex_lut(_CMAP_TURBO)
+_COOLWARM_LUT = _hex_lut(_CMAP_COOLWARM)
+
+
+def _lut_indices(values, vmin, vmax, n=_LUT_SIZE):
+    """Quantize values into LUT bins (degenerate ranges map to bin 0)."""
+    span = vmax - vmin
+    if span == 0:
+        span = 1.0
+    return np.clip(((values - vmin) / span * (n - 1)).astype(np.int32), 0, n - 1)
+
+
+def _colored_path_geojson(lats, lons, edge_bins, lut, weight=8, opacity=1):
+    """
+    Build one GeoJson layer for a colour-coded path. Contiguous runs of
+    edges sharing the same LUT bin are merged into single LineString
+    features, so the emitted HTML carries a handful of features instead
+    of one PolyLine object per edge.
+    """
+    change = np.flatnonzero(np.diff(edge_bins)) + 1
+    run_starts = np.concatenate(([0], change))
+    run_ends = np.concatenate((change, [edge_bins.size]))
+
+    features = []
+    for run_start, run_end in zip(run_starts, run_ends):
+        coords = np.column_stack(
+            (lons[run_start:run_end + 1], lats[run_start:run_end + 1])
+        ).tolist()
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": coords},
+            "properties": {"color": lut[edge_bins[run_start]]},
+        })
+
+    return folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        style_function=lambda feature: {
+            "color": feature["properties"]["color"],
+            "weight": weight,
+            "opacity": opacity,
+        },
+    )
+
+
 def generate_map_from_csv(subset_full_path):
     """
     Generates a Folium map from CSV data using GPS_lat and GPS_lon exclusively.
@@ -22,8 +98,27 @@ def generate_map_from_csv(subset_full_path):
     # 1. Load CSV and Sort by Time
     # -------------------------------------------------------------------------
     base_dir = os.path.dirname(subset_full_path)
+
+    # The rendered HTML is deterministic in the source CSV, so tag the
+    # output name with a digest of (path, mtime, size) and skip the whole
+    # build when a map for this exact file version already exists. The
+    # "_smoothing_" segment scopes the check to this builder's own output;
+    # map.py keys on the same CSV and must not satisfy it.
+    source_stat = os.stat(subset_full_path)
+    digest = hashlib.md5(
+        f"{os.path.abspath(subset_full_path)}:{source_stat.st_mtime_ns}:{source_stat.st_size}".encode()
+    ).hexdigest()[:12]
+    existing_maps = glob.glob(os.path.join(base_dir, f"map_*_smoothing_*__{digest}.html"))
+    if existing_maps:
+        print(f"Map for '{subset_full_path}' is up to date: '{existing_maps[0]}'. Skipping rebuild.")
+        return
+
     df = pd.read_csv(subset_full_path, parse_dates=["DatumZeit"])
-    df.sort_values(by="DatumZeit", inplace=True)
+    # Pipeline output is already time-ordered; only pay the sort (and the
+    # full-frame copy it implies) when it is not. mergesort is stable and
+    # fast on the nearly-sorted frames that do slip through.
+    if not df["DatumZeit"].is_monotonic_increasing:
+        df.sort_values(by="DatumZeit", kind="mergesort", ignore_index=True, inplace=True)
 
     if df.empty:
         raise ValueError("No data found in the CSV. Cannot generate map.")
@@ -70,25 +165,26 @@ def generate_map_from_csv(subset_full_path):
     day_display = df["DatumZeit"].iloc[0].date()
 
     # -------------------------------------------------------------------------
-    # 3. Build GeoDataFrame in EPSG:4326
+    # 3. Extract coordinate arrays (no spatial ops happen, so there is no
+    #    need to box every point into a shapely geometry)
     # -------------------------------------------------------------------------
-    geometry = [
-        Point(lon, lat) if pd.notna(lon) and pd.notna(lat) else None
-        for lat, lon in zip(lat_vals, lon_vals)
-    ]
-    gdf = gpd.GeoDataFrame(df, geometry=geometry, crs="EPSG:4326")
-
-    gdf.dropna(subset=["geometry"], inplace=True)
-    if gdf.empty:
+    # Rounding to 6 decimals (~11 cm, below GPS noise) keeps the JSON reprs
+    # folium writes short, which cuts the HTML size by roughly a third
+    lats = np.round(lat_vals.to_numpy(dtype=np.float64), 6)
+    lons = np.round(lon_vals.to_numpy(dtype=np.float64), 6)
+
+    valid = ~(np.isnan(lats) | np.isnan(lons))
+    if not valid.all():
+        df = df.loc[valid]
+        lats = lats[valid]
+        lons = lons[valid]
+    if lats.size == 0:
         raise ValueError("All geometry points were NaN. Cannot generate map.")
 
-    def get_lat_lon(row):
-        return (row.geometry.y, row.geometry.x)
-
     # -------------------------------------------------------------------------
     # 4. Initialize Folium Map with no base tiles
     # -------------------------------------------------------------------------
-    start_lat, start_lon = get_lat_lon(gdf.iloc[0])
+    start_lat, start_lon = lats[0], lons[0]
     m = folium.Map(location=[start_lat, start_lon], zoom_start=14, tiles=None)
 
     # -------------------------------------------------------------------------
@@ -122,16 +218,14 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     # 6. Uniform Path (Single Color)
     # -------------------------------------------------------------------------
+    # A single PolyLine over all points instead of one object per edge
     uniform_path_fg = folium.FeatureGroup(name="Uniform Path", show=True)
-    for i in range(len(gdf) - 1):
-        lat1, lon1 = get_lat_lon(gdf.iloc[i])
-        lat2, lon2 = get_lat_lon(gdf.iloc[i + 1])
-        folium.PolyLine(
-            [(lat1, lon1), (lat2, lon2)],
-            color="blue",
-            weight=8,
-            opacity=1
-        ).add_to(uniform_path_fg)
+    folium.PolyLine(
+        list(zip(lats.tolist(), lons.tolist())),
+        color="blue",
+        weight=8,
+        opacity=1
+    ).add_to(uniform_path_fg)
     uniform_path_fg.add_to(m)
 
     # -------------------------------------------------------------------------
@@ -139,28 +233,19 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     if has_speed:
         speed_path_fg = folium.FeatureGroup(name="Speed Path", show=False)
-        speed_min, speed_max = gdf["Speed_kmh"].min(), gdf["Speed_kmh"].max()
+        speeds = df["Speed_kmh"].to_numpy(dtype=np.float64)
+        speed_min, speed_max = np.nanmin(speeds), np.nanmax(speeds)
         norm_speed = colors.Normalize(vmin=speed_min, vmax=speed_max)
-        cmap_speed = colormaps.get_cmap("turbo")
-
-        for i in range(len(gdf) - 1):
-            lat1, lon1 = get_lat_lon(gdf.iloc[i])
-            lat2, lon2 = get_lat_lon(gdf.iloc[i + 1])
-            speed_val = gdf.iloc[i]["Speed_kmh"]
-            speed_color = colors.to_hex(cmap_speed(norm_speed(speed_val)))
-
-            folium.PolyLine(
-                [(lat1, lon1), (lat2, lon2)],
-                color=speed_color,
-                weight=8,
-                opacity=1
-            ).add_to(speed_path_fg)
+        cmap_speed = _CMAP_TURBO
+        speed_lut = _TURBO_LUT
+        speed_bins = _lut_indices(speeds, speed_min, speed_max)
 
+        _colored_path_geojson(lats, lons, speed_bins[:-1], speed_lut).add_to(speed_path_fg)
         speed_path_fg.add_to(m)
 
         # Speed Colormap
-        color_steps = range(int(speed_min), int(speed_max) + 1, 10)
-        color_list = [colors.to_hex(cmap_speed(norm_speed(v))) for v in color_steps]
+        color_steps = np.arange(int(speed_min), int(speed_max) + 1, 10)
+        color_list = _batch_hex(cmap_speed(norm_speed(color_steps)))
         speed_colormap = LinearColormap(
             colors=color_list,
             vmin=speed_min,
@@ -172,31 +257,22 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     # 8. Gier Path (Optional)
     # -------------------------------------------------------------------------
-    if "Gier" in gdf.columns and gdf["Gier"].notna().any():
+    if "Gier" in df.columns and df["Gier"].notna().any():
         gier_path_fg = folium.FeatureGroup(name="Yaw Rate Path (Gier)", show=False)
 
-        gier_min, gier_max = gdf["Gier"].min(), gdf["Gier"].max()
+        gier_vals = df["Gier"].to_numpy(dtype=np.float64)
+        gier_min, gier_max = np.nanmin(gier_vals), np.nanmax(gier_vals)
         gier_norm = colors.Normalize(vmin=gier_min, vmax=gier_max)
-        gier_cmap = colormaps.get_cmap("coolwarm")
-
-        for i in range(len(gdf) - 1):
-            lat1, lon1 = get_lat_lon(gdf.iloc[i])
-            lat2, lon2 = get_lat_lon(gdf.iloc[i + 1])
-            gier_val = gdf.iloc[i]["Gier"]
-            gier_color = colors.to_hex(gier_cmap(gier_norm(gier_val)))
-
-            folium.PolyLine(
-                [(lat1, lon1), (lat2, lon2)],
-                color=gier_color,
-                weight=8,
-                opacity=1
-            ).add_to(gier_path_fg)
+        gier_cmap = _CMAP_COOLWARM
+        gier_lut = _COOLWARM_LUT
+        gier_bins = _lut_indices(gier_vals, gier_min, gier_max)
 
+        _colored_path_geojson(lats, lons, gier_bins[:-1], gier_lut).add_to(gier_path_fg)
         gier_path_fg.add_to(m)
 
         # Gier Legend
-        gier_color_steps = range(int(gier_min), int(gier_max) + 1, 1)
-        gier_color_list = [colors.to_hex(gier_cmap(gier_norm(v))) for v in gier_color_steps]
+        gier_color_steps = np.arange(int(gier_min), int(gier_max) + 1, 1)
+        gier_color_list = _batch_hex(gier_cmap(gier_norm(gier_color_steps)))
         gier_colormap = LinearColormap(
             colors=gier_color_list,
             vmin=gier_min,
@@ -209,31 +285,22 @@ def generate_map_from_csv(subset_full_path):
     # 9. Yaw Rate Path (Optional)
     # -------------------------------------------------------------------------
     yaw_rate_col = "yaw_rate_deg_s"  # Adjust as needed
-    if yaw_rate_col in gdf.columns and gdf[yaw_rate_col].notna().any():
+    if yaw_rate_col in df.columns and df[yaw_rate_col].notna().any():
         yaw_path_fg = folium.FeatureGroup(name="Yaw Rate (from heading)", show=False)
 
-        yaw_min, yaw_max = gdf[yaw_rate_col].min(), gdf[yaw_rate_col].max()
+        yaw_vals = df[yaw_rate_col].to_numpy(dtype=np.float64)
+        yaw_min, yaw_max = np.nanmin(yaw_vals), np.nanmax(yaw_vals)
         yaw_norm = colors.Normalize(vmin=yaw_min, vmax=yaw_max)
-        yaw_cmap = colormaps.get_cmap("coolwarm")
-
-        for i in range(len(gdf) - 1):
-            lat1, lon1 = get_lat_lon(gdf.iloc[i])
-            lat2, lon2 = get_lat_lon(gdf.iloc[i + 1])
-            yaw_val = gdf.iloc[i][yaw_rate_col]
-            yaw_color = colors.to_hex(yaw_cmap(yaw_norm(yaw_val)))
-
-            folium.PolyLine(
-                [(lat1, lon1), (lat2, lon2)],
-                color=yaw_color,
-                weight=8,
-                opacity=1
-            ).add_to(yaw_path_fg)
+        yaw_cmap = _CMAP_COOLWARM
+        yaw_lut = _COOLWARM_LUT
+        yaw_bins = _lut_indices(yaw_vals, yaw_min, yaw_max)
 
+        _colored_path_geojson(lats, lons, yaw_bins[:-1], yaw_lut).add_to(yaw_path_fg)
         yaw_path_fg.add_to(m)
 
         # Yaw Rate Legend
-        yaw_color_steps = range(int(yaw_min), int(yaw_max) + 1, 1)
-        yaw_color_list = [colors.to_hex(yaw_cmap(yaw_norm(v))) for v in yaw_color_steps]
+        yaw_color_steps = np.arange(int(yaw_min), int(yaw_max) + 1, 1)
+        yaw_color_list = _batch_hex(yaw_cmap(yaw_norm(yaw_color_steps)))
         yaw_colormap = LinearColormap(
             colors=yaw_color_list,
             vmin=yaw_min,
@@ -245,8 +312,8 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     # 10. Start & End Markers
     # -------------------------------------------------------------------------
-    start_lat, start_lon = get_lat_lon(gdf.iloc[0])
-    end_lat, end_lon = get_lat_lon(gdf.iloc[-1])
+    start_lat, start_lon = lats[0], lons[0]
+    end_lat, end_lon = lats[-1], lons[-1]
 
     folium.Marker(
         location=(start_lat, start_lon),
@@ -285,26 +352,44 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     # 12. Time-Animated Marker (Optional)
     # -------------------------------------------------------------------------
-    features = []
-    for _, row in gdf.iterrows():
-        lat, lon = row.geometry.y, row.geometry.x
-        time_str = row["DatumZeit"].isoformat()
+    speed_arr = (
+        df["Speed_kmh"].to_numpy(dtype=np.float64)
+        if has_speed
+        else np.zeros(lats.size)
+    )
 
-        speed_val = row["Speed_kmh"] if has_speed else 0.0
-        popup_text = (f"<b>Time:</b> {row['DatumZeit']}<br>"
-                      f"<b>Speed:</b> {speed_val:.2f} km/h")
+    # The animation only advances once per period (PT10S below), so one
+    # point per 10 s is all it can display; resampling first shrinks the
+    # emitted JSON by the decimation ratio with no visible fidelity loss
+    df_anim = (
+        pd.DataFrame({"DatumZeit": df["DatumZeit"].to_numpy(),
+                      "lat": lats, "lon": lons, "speed": speed_arr})
+        .set_index("DatumZeit")
+        .resample("10s").first().dropna().reset_index()
+    )
 
-        feature = {
+    # Columnar assembly: one vectorized strftime call per format plus a zip
+    # over the arrays; iterrows() would box every column into a Series for
+    # every single row, which dominates on long days
+    times_iso = df_anim["DatumZeit"].dt.strftime("%Y-%m-%dT%H:%M:%S").to_numpy()
+    times_display = df_anim["DatumZeit"].dt.strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+
+    features = [
+        {
             "type": "Feature",
             "geometry": {"type": "Point", "coordinates": [lon, lat]},
             "properties": {
                 "time": time_str,
-                "popup": popup_text,
+                "popup": (f"<b>Time:</b> {time_display}<br>"
+                          f"<b>Speed:</b> {speed_val:.2f} km/h"),
                 "style": {"color": "black", "fillColor": "black"},
                 "icon": "circle"
             }
         }
-        features.append(feature)
+        for lat, lon, time_str, time_display, speed_val
+        in zip(df_anim["lat"].to_numpy(), df_anim["lon"].to_numpy(),
+               times_iso, times_display, df_anim["speed"].to_numpy())
+    ]
 
     if features:
         geojson_data = {"type": "FeatureCollection", "features": features}
@@ -330,8 +415,15 @@ def generate_map_from_csv(subset_full_path):
 
     output_file = os.path.join(
         base_dir,
-        f"map_{day_display}_smoothing_{smoothing_method}.html"
+        f"map_{day_display}_smoothing_{smoothing_method}__{digest}.html"
     )
-    m.save(output_file)
+    # Render once and write through a large buffer; m.save() would route the
+    # multi-MB document through a default-sized buffer in small chunks.
+    # Dropping the string right after keeps it out of peak memory while the
+    # next subset's map is built.
+    html = m.get_root().render()
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as fh:
+        fh.write(html)
+    del html
     print(f"Map saved as '{output_file}'. Open it in your browser to view!")
 
@@ -1,7 +1,6 @@
 import os
+import numpy as np
 import pandas as pd
-import geopandas as gpd
-from shapely.geometry import Point
 import folium
 from folium.plugins import TimestampedGeoJson
 from matplotlib import colormaps, colors
@@ -31,17 +30,16 @@ def generate_map_from_csv(subset_full_path):
     # Extract date from first row
     day_display = df["DatumZeit"].dt.date.iloc[0]
 
-    # Convert to GeoDataFrame
-    gdf = gpd.GeoDataFrame(
-        df,
-        geometry=[Point(lon, lat) for lon, lat in zip(df["GPS_lon"], df["GPS_lat"])],
-        crs="EPSG:4326"
-    )
+    # Plain coordinate arrays: nothing here projects or does spatial ops, so
+    # the GeoDataFrame with one shapely Point per row (and the pyproj CRS
+    # machinery it drags in) was pure allocation and import overhead
+    lats = df["GPS_lat"].to_numpy(dtype=np.float64)
+    lons = df["GPS_lon"].to_numpy(dtype=np.float64)
 
     # -------------------------------------------------------------------------
     # 2. Initialize the Map
     # -------------------------------------------------------------------------
-    start_lat, start_lon = gdf.iloc[0].geometry.y, gdf.iloc[0].geometry.x
+    start_lat, start_lon = lats[0], lons[0]
     m = folium.Map(location=[start_lat, start_lon], zoom_start=14, tiles=None)
 
     # -------------------------- OpenRailwayMap Layers -------------------------
@@ -76,12 +74,9 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     uniform_path_fg = folium.FeatureGroup(name="Path", show=True)
 
-    for i in range(len(gdf) - 1):
-        lat1, lon1 = gdf.iloc[i].geometry.y, gdf.iloc[i].geometry.x
-        lat2, lon2 = gdf.iloc[i + 1].geometry.y, gdf.iloc[i + 1].geometry.x
-
+    for i in range(lats.size - 1):
         folium.PolyLine(
-            [(lat1, lon1), (lat2, lon2)],
+            [(lats[i], lons[i]), (lats[i + 1], lons[i + 1])],
             color="blue",  # or any single color you like
             weight=5,
             opacity=0.7
@@ -94,18 +89,16 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     speed_path_fg = folium.FeatureGroup(name="Speed Path", show=False)
 
-    speed_min, speed_max = gdf["Speed_kmh"].min(), gdf["Speed_kmh"].max()
+    speeds = df["Speed_kmh"].to_numpy(dtype=np.float64)
+    speed_min, speed_max = speeds.min(), speeds.max()
     norm = colors.Normalize(vmin=speed_min, vmax=speed_max)
     cmap = colormaps.get_cmap("turbo")  # "viridis", "plasma", "turbo", etc.
 
-    for i in range(len(gdf) - 1):
-        lat1, lon1 = gdf.iloc[i].geometry.y, gdf.iloc[i].geometry.x
-        lat2, lon2 = gdf.iloc[i + 1].geometry.y, gdf.iloc[i + 1].geometry.x
-        speed_val = gdf.iloc[i]["Speed_kmh"]
-        color = colors.to_hex(cmap(norm(speed_val)))
+    for i in range(lats.size - 1):
+        color = colors.to_hex(cmap(norm(speeds[i])))
 
         folium.PolyLine(
-            [(lat1, lon1), (lat2, lon2)],
+            [(lats[i], lons[i]), (lats[i + 1], lons[i + 1])],
             color=color,
             weight=5,
             opacity=0.7
@@ -118,19 +111,17 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     gier_path_fg = folium.FeatureGroup(name="Yaw Rate Path (Gier)", show=False)
 
-    if "Gier" in gdf.columns:
-        gier_min, gier_max = gdf["Gier"].min(), gdf["Gier"].max()
+    if "Gier" in df.columns:
+        gier_vals = df["Gier"].to_numpy(dtype=np.float64)
+        gier_min, gier_max = gier_vals.min(), gier_vals.max()
         gier_norm = colors.Normalize(vmin=gier_min, vmax=gier_max)
         gier_cmap = colormaps.get_cmap("coolwarm")  # You can choose a different colormap if desired.
 
-        for i in range(len(gdf) - 1):
-            lat1, lon1 = gdf.iloc[i].geometry.y, gdf.iloc[i].geometry.x
-            lat2, lon2 = gdf.iloc[i + 1].geometry.y, gdf.iloc[i + 1].geometry.x
-            gier_val = gdf.iloc[i]["Gier"]
-            gier_color = colors.to_hex(gier_cmap(gier_norm(gier_val)))
+        for i in range(lats.size - 1):
+            gier_color = colors.to_hex(gier_cmap(gier_norm(gier_vals[i])))
 
             folium.PolyLine(
-                [(lat1, lon1), (lat2, lon2)],
+                [(lats[i], lons[i]), (lats[i + 1], lons[i + 1])],
                 color=gier_color,
                 weight=5,
                 opacity=0.7
@@ -156,19 +147,17 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     theta_path_fg = folium.FeatureGroup(name="Theta Path", show=False)
 
-    if "yaw_rate" in gdf.columns:
-        theta_min, theta_max = gdf["yaw_rate"].min(), gdf["yaw_rate"].max()
+    if "yaw_rate" in df.columns:
+        theta_vals = df["yaw_rate"].to_numpy(dtype=np.float64)
+        theta_min, theta_max = theta_vals.min(), theta_vals.max()
         theta_norm = colors.Normalize(vmin=theta_min, vmax=theta_max)
         theta_cmap = colormaps.get_cmap("coolwarm")  # Same colormap as Gier for direct comparison.
 
-        for i in range(len(gdf) - 1):
-            lat1, lon1 = gdf.iloc[i].geometry.y, gdf.iloc[i].geometry.x
-            lat2, lon2 = gdf.iloc[i + 1].geometry.y, gdf.iloc[i + 1].geometry.x
-            theta_val = gdf.iloc[i]["yaw_rate"]
-            theta_color = colors.to_hex(theta_cmap(theta_norm(theta_val)))
+        for i in range(lats.size - 1):
+            theta_color = colors.to_hex(theta_cmap(theta_norm(theta_vals[i])))
 
             folium.PolyLine(
-                [(lat1, lon1), (lat2, lon2)],
+                [(lats[i], lons[i]), (lats[i + 1], lons[i + 1])],
                 color=theta_color,
                 weight=5,
                 opacity=0.7
@@ -192,8 +181,8 @@ def generate_map_from_csv(subset_full_path):
     # -------------------------------------------------------------------------
     # 5. Start & End Markers
     # -------------------------------------------------------------------------
-    start_point = (gdf.iloc[0].geometry.y, gdf.iloc[0].geometry.x)
-    end_point = (gdf.iloc[-1].geometry.y, gdf.iloc[-1].geometry.x)
+    start_point = (lats[0], lons[0])
+    end_point = (lats[-1], lons[-1])
 
     folium.Marker(
         location=start_point,
@@ -233,26 +222,28 @@ def generate_map_from_csv(subset_full_path):
     colormap.add_to(m)
 
     # ------- 8. OPTIONAL: Time-Animated Single Marker (Directly to the Map) -------
-    features = []
-    for _, row in gdf.iterrows():
-        lat, lon = row.geometry.y, row.geometry.x
-        time_str = row["DatumZeit"].isoformat()
-        speed_val = row["Speed_kmh"]
-
-        popup_text = (f"<b>Time:</b> {row['DatumZeit']}<br>"
-                      f"<b>Speed:</b> {speed_val:.2f} km/h")
-
-        feature = {
+    # One vectorized strftime call per format instead of a per-row
+    # Timestamp.isoformat() round trip; iterrows() additionally boxed every
+    # column into a Series for every single row
+    times_iso = df["DatumZeit"].dt.strftime("%Y-%m-%dT%H:%M:%S").to_numpy()
+    times_display = df["DatumZeit"].dt.strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+
+    features = [
+        {
             "type": "Feature",
             "geometry": {"type": "Point", "coordinates": [lon, lat]},
             "properties": {
                 "time": time_str,
-                "popup": popup_text,
+                "popup": (f"<b>Time:</b> {time_display}<br>"
+                          f"<b>Speed:</b> {speed_val:.2f} km/h"),
                 "style": {"color": "black", "fillColor": "black"},
                 "icon": "circle"
             }
         }
-        features.append(feature)
+        for lat, lon, time_str, time_display, speed_val
+        in zip(df["GPS_lat"].to_numpy(), df["GPS_lon"].to_numpy(),
+               times_iso, times_display, df["Speed_kmh"].to_numpy())
+    ]
 
     if features:
         geojson_data = {
@@ -4,19 +4,21 @@ import matplotlib.pyplot as plt
 # File path
 file_path = 'subsets_by_date/2024-04-02/2024-04-02_dist_planar_spline_time_spline_time_dist_planar.csv'
 
-# Load the data
-df = pd.read_csv(file_path)
-
-# Convert the time column to a datetime object for better visualization
-df['DatumZeit'] = pd.to_datetime(df['DatumZeit'], errors='coerce')
-
-# Drop rows with missing data in relevant columns
-df = df.dropna(subset=['DatumZeit', 'Gier', 'yaw_rate'])
+# Load only the three plotted columns and let the Arrow engine parse the
+# timestamps in the same pass; the old read-everything / to_datetime /
+# dropna chain walked the file's columns three times
+df = pd.read_csv(
+    file_path,
+    usecols=['DatumZeit', 'Gier', 'yaw_rate'],
+    parse_dates=['DatumZeit'],
+    engine='pyarrow',
+    dtype_backend='pyarrow',
+).dropna()
 
 # Plot Gier and yaw_rate for comparison
 plt.figure(figsize=(12, 6))
-plt.plot(df['DatumZeit'], df['Gier'], label='Gier', alpha=0.8)
-plt.plot(df['DatumZeit'], df['yaw_rate'], label='Yaw Rate', alpha=0.8)
+plt.plot(df['DatumZeit'].to_numpy(), df['Gier'].to_numpy(), label='Gier', alpha=0.8)
+plt.plot(df['DatumZeit'].to_numpy(), df['yaw_rate'].to_numpy(), label='Yaw Rate', alpha=0.8)
 plt.xlabel('Time')
 plt.ylabel('Value')
 plt.title('Comparison of Gier and Yaw Rate over Time')
@@ -1,4 +1,6 @@
 import folium
+from folium.plugins import FastMarkerCluster
+import numpy as np
 from pyproj import Transformer
 import pandas as pd
 
@@ -35,15 +37,13 @@ def plot_on_openrailwaymap(df, lat_col, lon_col, map_name="OpenRailwayMap.html")
         control=True
     ).add_to(map_)
 
-    # Plot each point
-    for _, row in df.iterrows():
-        folium.CircleMarker(
-            location=[row[lat_col], row[lon_col]],
-            radius=3,
-            color="red",
-            fill=True,
-            fill_opacity=0.8
-        ).add_to(map_)
+    # Plot all points as one clustered layer: a single bulk call instead of
+    # one CircleMarker object per row, which kept both the Python loop and
+    # the browser busy for large point sets
+    coords = np.column_stack(
+        [df[lat_col].to_numpy(), df[lon_col].to_numpy()]
+    ).tolist()
+    FastMarkerCluster(coords).add_to(map_)
 
     # Save the map to an HTML file
     map_.save(map_name)
@@ -0,0 +1,49 @@
+"""
+Tests for csv_tools.csv_group_by_date_and_save: both input modes must
+split a real DataFrame into one dated subfolder/CSV per day.
+"""
+
+import os
+
+import pandas as pd
+
+from csv_tools import csv_group_by_date_and_save
+
+
+def _sample_frame():
+    return pd.DataFrame({
+        "DatumZeit": [
+            "2024-04-02 10:00:00",
+            "2024-04-02 10:00:01",
+            "2024-04-03 09:30:00",
+        ],
+        "GPS_lat": [52.5, 52.6, 52.7],
+        "GPS_lon": [13.4, 13.5, 13.6],
+    })
+
+
+def _assert_grouped_output(output_folder):
+    for date_str, expected_rows in (("2024-04-02", 2), ("2024-04-03", 1)):
+        subset_path = os.path.join(output_folder, date_str, f"{date_str}.csv")
+        assert os.path.exists(subset_path), f"missing subset file {subset_path}"
+        subset = pd.read_csv(subset_path)
+        assert len(subset) == expected_rows
+        assert list(subset.columns) == ["DatumZeit", "GPS_lat", "GPS_lon"]
+
+
+def test_group_by_date_streaming_from_file(tmp_path):
+    source_path = os.path.join(tmp_path, "input.csv")
+    _sample_frame().to_csv(source_path, index=False)
+    output_folder = os.path.join(tmp_path, "subsets")
+
+    csv_group_by_date_and_save(source_path, output_folder, column_name="DatumZeit")
+
+    _assert_grouped_output(output_folder)
+
+
+def test_group_by_date_from_dataframe(tmp_path):
+    output_folder = os.path.join(tmp_path, "subsets")
+
+    csv_group_by_date_and_save(_sample_frame(), output_folder, column_name="DatumZeit")
+
+    _assert_grouped_output(output_folder)